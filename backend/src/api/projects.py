@@ -4,15 +4,21 @@ Project API endpoints for Vagrantfile Generator.
 This module contains all API endpoints related to project management.
 """
 
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 from ..models import Project, ProjectCreate, ProjectUpdate, ProjectSummary, DeploymentStatus
 from ..models.user_profile import UserProfile
 from ..services import ProjectService, ProjectNotFoundError
+from ..services.validation_service import validate_project_pure
 from ..middleware.auth_middleware import get_optional_user
 
 router = APIRouter()
@@ -25,6 +31,44 @@ def get_project_service(
     user_id = current_user.user_id if current_user else None
     return ProjectService(user_id=user_id)
 
+
+# Process pool for CPU-bound batch validation, started on first use.
+# Sync dependencies run in the threadpool, so creation is guarded by a lock.
+_validation_pool: Optional[ProcessPoolExecutor] = None
+_validation_pool_lock = threading.Lock()
+
+
+def _validation_pool_size() -> int:
+    """Worker processes per app process; each gunicorn worker gets its own pool."""
+    configured = os.getenv("VALIDATION_POOL_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return min(4, os.cpu_count() or 1)
+
+
+def get_validation_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used for batch validation."""
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is None:
+            _validation_pool = ProcessPoolExecutor(max_workers=_validation_pool_size())
+        return _validation_pool
+
+
+def shutdown_validation_pool() -> None:
+    """Shut down the batch validation process pool if it was started."""
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is not None:
+            _validation_pool.shutdown()
+            _validation_pool = None
+
+
+class ProjectValidationBatchRequest(BaseModel):
+    """Request to validate several projects at once."""
+    project_ids: List[UUID]
+
+
 @router.get("/projects/stats", response_model=dict)
 async def get_project_stats(
     project_service: ProjectService = Depends(get_project_service)
@@ -158,4 +202,48 @@ async def validate_project(
         validation_result = project_service.validate_project(project_id)
         return validation_result
     except ProjectNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.post("/projects/validate", response_model=dict)
+async def validate_projects(
+    request: ProjectValidationBatchRequest,
+    project_service: ProjectService = Depends(get_project_service),
+    pool: ProcessPoolExecutor = Depends(get_validation_pool)
+):
+    """Validate several projects in parallel worker processes."""
+    # An unknown project fails the whole batch, like the single endpoint
+    for project_id in request.project_ids:
+        if not project_service.project_exists(project_id):
+            raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+    
+    loop = asyncio.get_running_loop()
+    
+    async def validate_one(project_id: UUID) -> dict:
+        project_data = project_service.get_project_data(project_id)
+        return await loop.run_in_executor(pool, validate_project_pure, project_data)
+    
+    # Any other failure is reported on its own project's entry
+    results = await asyncio.gather(
+        *(validate_one(project_id) for project_id in request.project_ids),
+        return_exceptions=True
+    )
+    
+    return {
+        "results": [
+            {"project_id": str(project_id), **_batch_result(result)}
+            for project_id, result in zip(request.project_ids, results)
+        ]
+    }
+
+
+def _batch_result(result) -> dict:
+    """Turn an exception raised for one project into a failed validation result."""
+    if not isinstance(result, Exception):
+        return result
+    return {
+        "is_valid": False,
+        "errors": [f"Validation failed: {result}"],
+        "warnings": [],
+        "vm_count": 0,
+        "network_interfaces_count": 0
+    }
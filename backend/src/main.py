@@ -11,7 +11,7 @@ from typing import List, Optional, TextIO
 import time
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -96,6 +96,7 @@ app = FastAPI(
     description="API for generating Vagrantfiles through a web interface",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -148,6 +149,14 @@ async def startup_validation():
     logger.info("Startup validation complete")
 
 
+@app.on_event("shutdown")
+async def shutdown_workers():
+    """Stop worker processes started by the batch validation endpoint."""
+    from .api.projects import shutdown_validation_pool
+
+    shutdown_validation_pool()
+
+
 # Configure CORS
 cors_origins = get_cors_origins()
 print(f"CORS Origins: {cors_origins}")
@@ -21,7 +21,8 @@ class CleanupService:
     
     def __init__(self):
         """Initialize the cleanup service."""
-        self.data_dir = Path(__file__).parent.parent.parent / "data"
+        env_path = os.getenv("DATA_DIR")
+        self.data_dir = Path(env_path) if env_path else Path(__file__).parent.parent.parent / "data"
         self.auth_dir = self.data_dir / "auth"
         self.users_dir = self.data_dir / "users"
         
@@ -22,13 +22,16 @@ class FileServiceError(Exception):
 class FileService:
     """Service for handling project file operations."""
     
-    def __init__(self, base_directory: str = "data"):
+    def __init__(self, base_directory: Optional[str] = None):
         """
         Initialize the file service.
         
         Args:
             base_directory: Base directory for storing project files
+                (defaults to the DATA_DIR environment variable, then "data")
         """
+        if base_directory is None:
+            base_directory = os.getenv("DATA_DIR", "data")
         self.base_directory = Path(base_directory)
         self.shared_directory = self.base_directory / "shared"
         self.users_directory = self.base_directory / "users"
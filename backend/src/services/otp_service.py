@@ -69,13 +69,15 @@ def load_test_users() -> dict[str, str]:
 class OTPService:
     """Service for managing email OTP authentication."""
 
-    def __init__(self, storage_path: str = "data/auth/otp-requests.json"):
-        """Initialize OTP service with storage configuration."""
-        self.storage_path = Path(storage_path)
+    def __init__(self, storage_path: Optional[str] = None):
+        """Initialize OTP service with storage configuration (defaults to auth/ under DATA_DIR)."""
+        self.file_service = FileService()
+        self.storage_path = (
+            Path(storage_path) if storage_path else self.file_service.auth_directory / "otp-requests.json"
+        )
         self.otp_length = int(os.getenv("OTP_LENGTH", "6"))
         self.expiration_minutes = int(os.getenv("OTP_EXPIRATION_MINUTES", "15"))
         self.max_attempts = int(os.getenv("OTP_MAX_ATTEMPTS", "3"))
-        self.file_service = FileService()
 
         # Test user configuration
         self.test_users = load_test_users()
@@ -14,6 +14,7 @@ from uuid import UUID
 
 from ..models import Project, ProjectCreate, ProjectUpdate, ProjectSummary, VirtualMachine, NetworkInterface, DeploymentStatus
 from .file_service import FileService
+from .validation_service import generation_validation_result
 
 
 class ProjectNotFoundError(Exception):
@@ -21,6 +22,49 @@ class ProjectNotFoundError(Exception):
     pass
 
 
+def _construct_vm_without_validation(vm_data: Dict[str, Any]) -> VirtualMachine:
+    """Construct a VirtualMachine without validation for backward compatibility."""
+    # Handle network interfaces separately
+    network_interfaces = []
+    if 'network_interfaces' in vm_data:
+        for ni_data in vm_data['network_interfaces']:
+            network_interfaces.append(NetworkInterface.construct(**ni_data))
+        vm_data = {**vm_data, 'network_interfaces': network_interfaces}
+    
+    return VirtualMachine.construct(**vm_data)
+
+
+def project_from_stored_data(data: Dict[str, Any]) -> Project:
+    """
+    Build a Project from its stored JSON without validation.
+    
+    Legacy projects may no longer pass the current model validators, so they
+    are constructed as stored rather than rejected.
+    
+    Args:
+        data: The project as read from its JSON file
+        
+    Returns:
+        Project instance
+    """
+    # Convert datetime strings to datetime objects if they exist
+    if 'created_at' in data and isinstance(data['created_at'], str):
+        data = {**data, 'created_at': datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))}
+    if 'updated_at' in data and isinstance(data['updated_at'], str):
+        data = {**data, 'updated_at': datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))}
+    
+    # Handle VMs separately to avoid validation issues
+    if 'vms' in data:
+        data = {**data, 'vms': [_construct_vm_without_validation(vm_data) for vm_data in data['vms']]}
+    
+    # global_plugins, global_provisioners, and global_triggers are now just lists of IDs (strings)
+    # No special handling needed - they're already in the correct format
+    
+    # Use construct() to create model without validation for existing data
+    # This maintains backward compatibility with legacy projects
+    return Project.construct(**data)
+
+
 class ProjectService:
     """Service class for managing Project entities."""
 
@@ -47,19 +91,29 @@ class ProjectService:
         """Get the file path for a project's JSON file."""
         return self.data_dir / f"{project_id}.json"
 
-    def _construct_vm_without_validation(self, vm_data: Dict[str, Any]) -> VirtualMachine:
-        """Construct a VirtualMachine without validation for backward compatibility."""
-        # Handle network interfaces separately
-        network_interfaces = []
-        if 'network_interfaces' in vm_data:
-            for ni_data in vm_data['network_interfaces']:
-                network_interfaces.append(NetworkInterface.construct(**ni_data))
-            vm_data = {**vm_data, 'network_interfaces': network_interfaces}
-        
-        return VirtualMachine.construct(**vm_data)
-
     def _load_project_from_file(self, project_id: UUID) -> Project:
         """Load a project from its JSON file with minimal validation for backward compatibility."""
+        data = self.get_project_data(project_id)
+        
+        try:
+            return project_from_stored_data(data)
+        except ValueError as e:
+            raise ValueError(f"Invalid project data in {self._get_project_file_path(project_id)}: {e}")
+
+    def get_project_data(self, project_id: UUID) -> Dict[str, Any]:
+        """
+        Read a project's stored JSON without building a model.
+        
+        Args:
+            project_id: Project UUID
+            
+        Returns:
+            The project as stored on disk
+            
+        Raises:
+            ProjectNotFoundError: If project doesn't exist
+            ValueError: If the project file is not valid JSON
+        """
         file_path = self._get_project_file_path(project_id)
         
         # In public mode, only load from user directory (no fallback to shared)
@@ -69,28 +123,8 @@ class ProjectService:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Convert datetime strings to datetime objects if they exist
-            if 'created_at' in data and isinstance(data['created_at'], str):
-                data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-            if 'updated_at' in data and isinstance(data['updated_at'], str):
-                data['updated_at'] = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
-            
-            # Handle VMs separately to avoid validation issues
-            vms = []
-            if 'vms' in data:
-                for vm_data in data['vms']:
-                    vms.append(self._construct_vm_without_validation(vm_data))
-                data = {**data, 'vms': vms}
-            
-            # global_plugins, global_provisioners, and global_triggers are now just lists of IDs (strings)
-            # No special handling needed - they're already in the correct format
-            
-            # Use construct() to create model without validation for existing data
-            # This maintains backward compatibility with legacy projects
-            return Project.construct(**data)
-        except (json.JSONDecodeError, ValueError) as e:
+                return json.load(f)
+        except json.JSONDecodeError as e:
             raise ValueError(f"Invalid project data in {file_path}: {e}")
 
     def _save_project_to_file(self, project: Project) -> None:
@@ -494,16 +528,7 @@ class ProjectService:
             ProjectNotFoundError: If project doesn't exist
         """
         project = self._load_project_from_file(project_id)
-        
-        is_valid, errors, warnings = project.validate_for_generation()
-        
-        return {
-            "is_valid": is_valid,
-            "errors": errors,
-            "warnings": warnings,
-            "vm_count": len(project.vms),
-            "network_interfaces_count": sum(len(vm.network_interfaces) for vm in project.vms)
-        }
+        return generation_validation_result(project)
 
     def project_exists(self, project_id: UUID) -> bool:
         """
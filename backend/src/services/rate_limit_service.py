@@ -21,12 +21,14 @@ logger = logging.getLogger(__name__)
 class RateLimitService:
     """Service for rate limiting OTP requests."""
     
-    def __init__(self, storage_path: str = "data/auth/rate-limits.json"):
-        """Initialize rate limit service with storage configuration."""
-        self.storage_path = Path(storage_path)
+    def __init__(self, storage_path: Optional[str] = None):
+        """Initialize rate limit service with storage configuration (defaults to auth/ under DATA_DIR)."""
+        self.file_service = FileService()
+        self.storage_path = (
+            Path(storage_path) if storage_path else self.file_service.auth_directory / "rate-limits.json"
+        )
         self.max_requests = int(os.getenv("OTP_RATE_LIMIT_MAX_REQUESTS", "5"))
         self.window_hours = int(os.getenv("OTP_RATE_LIMIT_WINDOW_HOURS", "1"))
-        self.file_service = FileService()
         
         # Ensure storage directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
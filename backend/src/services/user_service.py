@@ -20,11 +20,11 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service for managing user profiles."""
     
-    def __init__(self, base_path: str = "data/users"):
-        """Initialize user service with storage configuration."""
-        self.base_path = Path(base_path)
-        self.base_path.mkdir(parents=True, exist_ok=True)
+    def __init__(self, base_path: Optional[str] = None):
+        """Initialize user service with storage configuration (defaults to users/ under DATA_DIR)."""
         self.file_service = FileService()
+        self.base_path = Path(base_path) if base_path else self.file_service.users_directory
+        self.base_path.mkdir(parents=True, exist_ok=True)
     
     def create_or_update_user(
         self,
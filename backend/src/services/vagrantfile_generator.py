@@ -5,6 +5,7 @@ This service generates Vagrantfile content from Project configurations
 using Jinja2 templates.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 from jinja2 import Environment, BaseLoader, Template
 
@@ -21,6 +22,41 @@ class StringTemplateLoader(BaseLoader):
         return self.template_string, None, lambda: True
 
 
+def _indent_filter(text: str, width: int = 4, first: bool = True) -> str:
+    """Custom Jinja2 filter for indenting text."""
+    lines = text.split('\n')
+    indent = ' ' * width
+    
+    result = []
+    for i, line in enumerate(lines):
+        if line.strip():  # Don't indent empty lines
+            if i == 0 and not first:
+                result.append(line)
+            else:
+                result.append(indent + line)
+        else:
+            result.append(line)
+    
+    return '\n'.join(result)
+
+
+@lru_cache(maxsize=8)
+def _compile_template(template_string: str) -> Template:
+    """
+    Compile a Vagrantfile template once per process.
+    
+    A generator is built for every request, so compiling here rather than in
+    __init__ keeps Jinja2 from re-parsing the same template on each call.
+    """
+    env = Environment(
+        loader=StringTemplateLoader(template_string),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    env.filters['indent'] = _indent_filter
+    return env.get_template("")
+
+
 class VagrantfileGenerator:
     """Service for generating Vagrantfiles from Project configurations."""
     
@@ -143,32 +179,9 @@ end
         template_str = template_string or self.VAGRANTFILE_TEMPLATE
         self.user_id = user_id
         
-        # Setup Jinja2 environment
-        self.env = Environment(
-            loader=StringTemplateLoader(template_str),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self.env.filters['indent'] = self._indent_filter
-
-    def _indent_filter(self, text: str, width: int = 4, first: bool = True) -> str:
-        """Custom Jinja2 filter for indenting text."""
-        lines = text.split('\n')
-        indent = ' ' * width
-        
-        result = []
-        for i, line in enumerate(lines):
-            if line.strip():  # Don't indent empty lines
-                if i == 0 and not first:
-                    result.append(line)
-                else:
-                    result.append(indent + line)
-            else:
-                result.append(line)
-        
-        return '\n'.join(result)
+        # Compiled template and its Jinja2 environment are shared across instances
+        self.template = _compile_template(template_str)
+        self.env = self.template.environment
 
     def generate(self, project: Project) -> Dict[str, Any]:
         """
@@ -243,7 +256,6 @@ end
         content = ""
         if project.vms:  # Only generate if there are VMs
             try:
-                template = self.env.get_template("")
                 # Create a modified project dict with enriched plugins
                 from types import SimpleNamespace
                 project_dict = project.model_dump()
@@ -252,7 +264,7 @@ end
                 # Convert VMs to proper namespace objects
                 project_for_template.vms = project.vms
                 
-                content = template.render(
+                content = self.template.render(
                     project=project_for_template,
                     global_provisioners=global_provisioners,
                     global_triggers=global_triggers,
@@ -4,27 +4,141 @@ ValidationService for Vagrantfile Generator.
 This service provides validation logic for projects, VMs, and configurations.
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, TypedDict
 import re
 import ipaddress
 from ..models.project import Project
 from ..models.virtual_machine import VirtualMachine
 from ..models.network_interface import NetworkInterface
 
+# Allowed characters for project and VM names
+_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# VM names considered too generic to be descriptive
+_GENERIC_VM_NAMES = frozenset({"vm", "test", "box", "server", "machine"})
+
+# Boxes known to be available from Vagrant Cloud
+_COMMON_BOXES = frozenset({"ubuntu/jammy64", "ubuntu/focal64", "centos/7", "debian/bullseye64"})
+
+
+class ValidationResult(TypedDict):
+    """Result returned by every ValidationService check."""
+    is_valid: bool
+    errors: List[str]
+    warnings: List[str]
+    suggestions: List[str]
+
+
+def _scan_vagrantfile(content: str) -> Dict[str, Any]:
+    """
+    Collect the structural markers checked by validate_vagrantfile_syntax.
+    
+    Each marker is probed exactly once with C-level substring searches, which
+    stop at the first hit; only the quote count has to walk the whole file.
+    
+    Args:
+        content: The Vagrantfile content
+        
+    Returns:
+        Dictionary of marker flags and the total quote count
+    """
+    saw_box_version = "config.vm.box_version" in content
+    return {
+        "saw_configure": "Vagrant.configure" in content,
+        "saw_vm_define": "config.vm.define" in content,
+        "saw_vm_box": saw_box_version or "config.vm.box" in content,
+        "saw_box_version": saw_box_version,
+        "quote_count": content.count('"'),
+        "saw_end": "end" in content,
+    }
+
+
+def _dotted_quad_to_int(text: str) -> Optional[int]:
+    """
+    Convert a dotted-quad IPv4 string to its 32-bit integer value.
+    
+    Uses the same octet rules as ipaddress.IPv4Address (ASCII digits only,
+    no leading zeros, 0-255) without allocating address objects.
+    
+    Args:
+        text: The dotted-quad string
+        
+    Returns:
+        The integer value, or None if the string is not a valid address
+    """
+    parts = text.split(".")
+    if len(parts) != 4:
+        return None
+    value = 0
+    for part in parts:
+        if not (part.isascii() and part.isdigit()) or len(part) > 3 or (part[0] == "0" and part != "0"):
+            return None
+        octet = int(part)
+        if octet > 255:
+            return None
+        value = (value << 8) | octet
+    return value
+
+
+def _netmask_prefix(netmask: str) -> Optional[int]:
+    """
+    Parse a netmask into its prefix length using integer arithmetic only.
+    
+    Accepts the forms the NetworkInterface model allows ("24", "/24" and
+    dotted-quad netmasks) as well as dotted-quad hostmasks, which
+    ipaddress.IPv4Network has always accepted here.
+    
+    Args:
+        netmask: The netmask to parse
+        
+    Returns:
+        The prefix length, or None if the netmask is invalid
+    """
+    if not isinstance(netmask, str):
+        return None
+    
+    # Prefix length, with or without the CIDR slash
+    digits = netmask[1:] if netmask.startswith("/") else netmask
+    if digits.isascii() and digits.isdigit():
+        prefix = int(digits)
+        return prefix if prefix <= 32 else None
+    
+    mask = _dotted_quad_to_int(netmask)
+    if mask is None:
+        return None
+    
+    # A netmask is leading ones then zeros; a hostmask is its inverse
+    inverted = mask ^ 0xFFFFFFFF
+    if inverted & (inverted + 1) == 0:
+        return 32 - inverted.bit_length()
+    if mask & (mask + 1) == 0:
+        return 32 - mask.bit_length()
+    return None
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
+class _Bag:
+    """Message lists filled in place by the project-level checks."""
+    __slots__ = ("errors", "warnings", "suggestions")
+    
+    def __init__(self) -> None:
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.suggestions: List[str] = []
+
+
 class ValidationService:
     """Service for validating project configurations."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the validation service."""
         pass
     
-    def validate_project(self, project: Project) -> Dict[str, Any]:
+    def validate_project(self, project: Project) -> ValidationResult:
         """
         Validate a complete project configuration.
         
@@ -34,218 +148,221 @@ class ValidationService:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": [],
-            "suggestions": []
-        }
+        bag = _Bag()
         
         try:
             # Basic project validation
-            self._validate_project_basic(project, results)
+            self._validate_project_basic(project, bag)
             
             # VM validation
-            self._validate_project_vms(project, results)
+            self._validate_project_vms(project, bag)
             
             # Network validation
-            self._validate_project_networking(project, results)
+            self._validate_project_networking(project, bag)
             
             # Resource validation
-            self._validate_project_resources(project, results)
+            self._validate_project_resources(project, bag)
             
             # Best practices validation
-            self._validate_project_best_practices(project, results)
+            self._validate_project_best_practices(project, bag)
             
         except ValidationError as e:
-            results["is_valid"] = False
-            results["errors"].append(str(e))
+            bag.errors.append(str(e))
         
-        # Set overall validity
-        if results["errors"]:
-            results["is_valid"] = False
+        results: ValidationResult = {
+            "is_valid": not bag.errors,
+            "errors": bag.errors,
+            "warnings": bag.warnings,
+            "suggestions": bag.suggestions
+        }
         
         return results
     
-    def _validate_project_basic(self, project: Project, results: Dict[str, Any]):
+    def _validate_project_basic(self, project: Project, bag: _Bag) -> None:
         """Validate basic project properties."""
         # Check project name
         if not project.name or len(project.name.strip()) == 0:
-            results["errors"].append("Project name cannot be empty")
+            bag.errors.append("Project name cannot be empty")
         
         if len(project.name) > 50:
-            results["errors"].append("Project name cannot exceed 50 characters")
+            bag.errors.append("Project name cannot exceed 50 characters")
         
         # Check for invalid characters in project name
-        if not re.match(r'^[a-zA-Z0-9_-]+$', project.name):
-            results["errors"].append("Project name can only contain letters, numbers, underscores, and hyphens")
+        if not _NAME_RE.match(project.name):
+            bag.errors.append("Project name can only contain letters, numbers, underscores, and hyphens")
         
         # Check VM count
         if len(project.vms) == 0:
-            results["warnings"].append("Project has no VMs defined")
+            bag.warnings.append("Project has no VMs defined")
         
         if len(project.vms) > 10:
-            results["warnings"].append("Project has many VMs - this may impact performance")
+            bag.warnings.append("Project has many VMs - this may impact performance")
     
-    def _validate_project_vms(self, project: Project, results: Dict[str, Any]):
+    def _validate_project_vms(self, project: Project, bag: _Bag) -> None:
         """Validate VM configurations."""
-        vm_names = set()
+        seen_counts: Dict[str, int] = {}
         
         for vm in project.vms:
-            # Check for duplicate VM names
-            if vm.name in vm_names:
-                results["errors"].append(f"Duplicate VM name: {vm.name}")
-            vm_names.add(vm.name)
+            seen_counts[vm.name] = seen_counts.get(vm.name, 0) + 1
+            
+            # Name format is checked here so validate_vm can skip the regex
+            if not _NAME_RE.match(vm.name):
+                bag.errors.append(f"VM '{vm.name}': VM name can only contain letters, numbers, underscores, and hyphens")
             
             # Validate individual VM
-            vm_results = self.validate_vm(vm)
+            vm_results = self.validate_vm(vm, _skip_regex=True)
             if not vm_results["is_valid"]:
-                results["errors"].extend([f"VM '{vm.name}': {error}" for error in vm_results["errors"]])
-            results["warnings"].extend([f"VM '{vm.name}': {warning}" for warning in vm_results["warnings"]])
-            results["suggestions"].extend([f"VM '{vm.name}': {suggestion}" for suggestion in vm_results["suggestions"]])
+                bag.errors.extend([f"VM '{vm.name}': {error}" for error in vm_results["errors"]])
+            bag.warnings.extend([f"VM '{vm.name}': {warning}" for warning in vm_results["warnings"]])
+            bag.suggestions.extend([f"VM '{vm.name}': {suggestion}" for suggestion in vm_results["suggestions"]])
+        
+        # Report each duplicated name once, with the number of VMs sharing it
+        for name, count in seen_counts.items():
+            if count > 1:
+                bag.errors.append(f"Duplicate VM name: {name} (used by {count} VMs)")
     
-    def _validate_project_networking(self, project: Project, results: Dict[str, Any]):
+    def _validate_project_networking(self, project: Project, bag: _Bag) -> None:
         """Validate network configurations across VMs."""
-        used_ips = set()
+        # Valid addresses are keyed by their 32-bit value, unparsable ones by text
+        used_ips: Set[Any] = set()
+        private_networks = []
         
         for vm in project.vms:
             for interface in vm.network_interfaces:
                 if interface.ip_address:
+                    ip = _dotted_quad_to_int(interface.ip_address)
+                    key = interface.ip_address if ip is None else ip
+                    
                     # Check for IP conflicts
-                    if interface.ip_address in used_ips:
-                        results["errors"].append(f"IP address conflict: {interface.ip_address} is used by multiple VMs")
-                    used_ips.add(interface.ip_address)
+                    if key in used_ips:
+                        bag.errors.append(f"IP address conflict: {interface.ip_address} is used by multiple VMs")
+                    used_ips.add(key)
                     
                     # Validate IP address format
-                    try:
-                        ipaddress.IPv4Address(interface.ip_address)
-                    except ipaddress.AddressValueError:
-                        results["errors"].append(f"Invalid IP address: {interface.ip_address}")
-        
-        # Check for common network issues
-        private_networks = []
-        for vm in project.vms:
-            for interface in vm.network_interfaces:
-                if interface.type == "private_network" and interface.ip_address:
-                    try:
-                        ip = ipaddress.IPv4Address(interface.ip_address)
-                        network = ipaddress.IPv4Network(f"{interface.ip_address}/{interface.netmask}", strict=False)
-                        private_networks.append(network)
-                    except (ipaddress.AddressValueError, ipaddress.NetmaskValueError):
-                        pass  # Already handled above
+                    if ip is None:
+                        bag.errors.append(f"Invalid IP address: {interface.ip_address}")
+                        continue
+                    
+                    # Collect private networks as (first, last, prefix) address ranges
+                    if interface.type == "private_network":
+                        prefix = _netmask_prefix(interface.netmask)
+                        if prefix is not None:
+                            size = 1 << (32 - prefix)
+                            first = ip & ~(size - 1)
+                            private_networks.append((first, first + size - 1, prefix))
         
         # Check for overlapping networks
-        for i, net1 in enumerate(private_networks):
-            for net2 in private_networks[i+1:]:
-                if net1.overlaps(net2):
-                    results["warnings"].append(f"Overlapping networks detected: {net1} and {net2}")
+        for i, (first1, last1, prefix1) in enumerate(private_networks):
+            for first2, last2, prefix2 in private_networks[i+1:]:
+                if first1 <= last2 and first2 <= last1:
+                    net1 = f"{ipaddress.IPv4Address(first1)}/{prefix1}"
+                    net2 = f"{ipaddress.IPv4Address(first2)}/{prefix2}"
+                    bag.warnings.append(f"Overlapping networks detected: {net1} and {net2}")
     
-    def _validate_project_resources(self, project: Project, results: Dict[str, Any]):
+    def _validate_project_resources(self, project: Project, bag: _Bag) -> None:
         """Validate resource allocations."""
-        total_memory = sum(vm.memory for vm in project.vms)
-        total_cpus = sum(vm.cpus for vm in project.vms)
+        total_memory = 0
+        total_cpus = 0
+        
+        # Individual VM resource checks, accumulating totals in the same pass
+        for vm in project.vms:
+            total_memory += vm.memory
+            total_cpus += vm.cpus
+            
+            if vm.memory < 512:
+                bag.warnings.append(f"VM '{vm.name}' has low memory allocation: {vm.memory}MB")
+            
+            if vm.memory > 8192:
+                bag.warnings.append(f"VM '{vm.name}' has high memory allocation: {vm.memory}MB")
+            
+            if vm.cpus > 4:
+                bag.warnings.append(f"VM '{vm.name}' has high CPU allocation: {vm.cpus} CPUs")
         
         # Memory warnings
         if total_memory > 16384:  # 16GB
-            results["warnings"].append(f"High total memory allocation: {total_memory}MB across all VMs")
+            bag.warnings.append(f"High total memory allocation: {total_memory}MB across all VMs")
         
         if total_memory > 32768:  # 32GB
-            results["errors"].append(f"Excessive memory allocation: {total_memory}MB may cause host system issues")
+            bag.errors.append(f"Excessive memory allocation: {total_memory}MB may cause host system issues")
         
         # CPU warnings
         if total_cpus > 8:
-            results["warnings"].append(f"High total CPU allocation: {total_cpus} CPUs across all VMs")
+            bag.warnings.append(f"High total CPU allocation: {total_cpus} CPUs across all VMs")
         
         if total_cpus > 16:
-            results["errors"].append(f"Excessive CPU allocation: {total_cpus} CPUs may cause host system issues")
-        
-        # Individual VM resource checks
-        for vm in project.vms:
-            if vm.memory < 512:
-                results["warnings"].append(f"VM '{vm.name}' has low memory allocation: {vm.memory}MB")
-            
-            if vm.memory > 8192:
-                results["warnings"].append(f"VM '{vm.name}' has high memory allocation: {vm.memory}MB")
-            
-            if vm.cpus > 4:
-                results["warnings"].append(f"VM '{vm.name}' has high CPU allocation: {vm.cpus} CPUs")
+            bag.errors.append(f"Excessive CPU allocation: {total_cpus} CPUs may cause host system issues")
     
-    def _validate_project_best_practices(self, project: Project, results: Dict[str, Any]):
+    def _validate_project_best_practices(self, project: Project, bag: _Bag) -> None:
         """Validate against best practices."""
-        # Check for descriptive names
-        generic_names = {"vm", "test", "box", "server", "machine"}
-        for vm in project.vms:
-            if vm.name.lower() in generic_names:
-                results["suggestions"].append(f"VM '{vm.name}' has a generic name - consider a more descriptive name")
-        
         # Check for project description
         if not project.description or len(project.description.strip()) == 0:
-            results["suggestions"].append("Consider adding a project description")
-        
-        # Check for common box names
-        common_boxes = {"ubuntu/jammy64", "ubuntu/focal64", "centos/7", "debian/bullseye64"}
-        for vm in project.vms:
-            if vm.box not in common_boxes:
-                results["suggestions"].append(f"VM '{vm.name}' uses box '{vm.box}' - ensure it's available")
+            bag.suggestions.append("Consider adding a project description")
         
-        # Check hostname configuration
         for vm in project.vms:
+            # Check for descriptive names
+            if vm.name.lower() in _GENERIC_VM_NAMES:
+                bag.suggestions.append(f"VM '{vm.name}' has a generic name - consider a more descriptive name")
+            
+            # Check for common box names
+            if vm.box not in _COMMON_BOXES:
+                bag.suggestions.append(f"VM '{vm.name}' uses box '{vm.box}' - ensure it's available")
+            
+            # Check hostname configuration
             if not vm.hostname:
-                results["suggestions"].append(f"VM '{vm.name}' has no hostname set - it will default to VM name")
+                bag.suggestions.append(f"VM '{vm.name}' has no hostname set - it will default to VM name")
     
-    def validate_vm(self, vm: VirtualMachine) -> Dict[str, Any]:
+    def validate_vm(self, vm: VirtualMachine, _skip_regex: bool = False) -> ValidationResult:
         """
         Validate a single VM configuration.
         
         Args:
             vm: The VM to validate
+            _skip_regex: Skip the name format check (already done by the caller)
             
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": [],
-            "suggestions": []
-        }
+        errors: List[str] = []
+        warnings: List[str] = []
+        suggestions: List[str] = []
         
         # Name validation
-        if not re.match(r'^[a-zA-Z0-9_-]+$', vm.name):
-            results["errors"].append("VM name can only contain letters, numbers, underscores, and hyphens")
+        if not _skip_regex and not _NAME_RE.match(vm.name):
+            errors.append("VM name can only contain letters, numbers, underscores, and hyphens")
         
         # Box validation
         if not vm.box or len(vm.box.strip()) == 0:
-            results["errors"].append("VM box cannot be empty")
+            errors.append("VM box cannot be empty")
         
         # Resource validation
         if vm.memory < 512:
-            results["warnings"].append("Memory allocation is below recommended minimum (512MB)")
+            warnings.append("Memory allocation is below recommended minimum (512MB)")
         
         if vm.memory > 8192:
-            results["warnings"].append("High memory allocation may impact host system")
+            warnings.append("High memory allocation may impact host system")
         
         if vm.cpus < 1:
-            results["errors"].append("VM must have at least 1 CPU")
+            errors.append("VM must have at least 1 CPU")
         
         if vm.cpus > 4:
-            results["warnings"].append("High CPU allocation may impact host system")
+            warnings.append("High CPU allocation may impact host system")
         
         # Network interface validation
         for interface in vm.network_interfaces:
             interface_results = self.validate_network_interface(interface)
             if not interface_results["is_valid"]:
-                results["errors"].extend(interface_results["errors"])
-            results["warnings"].extend(interface_results["warnings"])
-            results["suggestions"].extend(interface_results["suggestions"])
-        
-        # Set overall validity
-        if results["errors"]:
-            results["is_valid"] = False
-        
-        return results
+                errors.extend(interface_results["errors"])
+            warnings.extend(interface_results["warnings"])
+            suggestions.extend(interface_results["suggestions"])
+        
+        return {
+            "is_valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "suggestions": suggestions
+        }
     
-    def validate_network_interface(self, interface: NetworkInterface) -> Dict[str, Any]:
+    def validate_network_interface(self, interface: NetworkInterface) -> ValidationResult:
         """
         Validate a network interface configuration.
         
@@ -255,62 +372,58 @@ class ValidationService:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": [],
-            "suggestions": []
-        }
+        errors: List[str] = []
+        warnings: List[str] = []
+        suggestions: List[str] = []
         
         # Static IP validation
         if interface.ip_assignment == "static":
             if not interface.ip_address:
-                results["errors"].append("Static IP assignment requires an IP address")
+                errors.append("Static IP assignment requires an IP address")
             else:
                 try:
                     ip = ipaddress.IPv4Address(interface.ip_address)
                     
                     # Check for commonly problematic IPs
                     if ip.is_loopback:
-                        results["errors"].append("Cannot use loopback IP address")
+                        errors.append("Cannot use loopback IP address")
                     elif ip.is_multicast:
-                        results["errors"].append("Cannot use multicast IP address")
+                        errors.append("Cannot use multicast IP address")
                     elif ip.is_reserved:
-                        results["warnings"].append("Using reserved IP address range")
+                        warnings.append("Using reserved IP address range")
                     
                     # Check for private network ranges
                     if not ip.is_private and interface.type == "private_network":
-                        results["warnings"].append("Public IP address used in private network")
+                        warnings.append("Public IP address used in private network")
                     
                 except ipaddress.AddressValueError:
-                    results["errors"].append(f"Invalid IP address format: {interface.ip_address}")
+                    errors.append(f"Invalid IP address format: {interface.ip_address}")
         
         # Netmask validation
-        try:
-            ipaddress.IPv4Network(f"192.168.1.1/{interface.netmask}", strict=False)
-        except ipaddress.NetmaskValueError:
-            results["errors"].append(f"Invalid netmask: {interface.netmask}")
+        if _netmask_prefix(interface.netmask) is None:
+            errors.append(f"Invalid netmask: {interface.netmask}")
         
         # Port forwarding validation
         if interface.type == "forwarded_port":
             if interface.guest_port is None or interface.host_port is None:
-                results["errors"].append("Port forwarding requires both guest and host ports")
+                errors.append("Port forwarding requires both guest and host ports")
             elif interface.guest_port == interface.host_port:
-                results["suggestions"].append("Guest and host ports are the same")
+                suggestions.append("Guest and host ports are the same")
             
             # Check for common port conflicts
             common_ports = {22: "SSH", 80: "HTTP", 443: "HTTPS", 3306: "MySQL", 5432: "PostgreSQL"}
             if interface.host_port in common_ports:
                 service = common_ports[interface.host_port]
-                results["warnings"].append(f"Host port {interface.host_port} is commonly used by {service}")
+                warnings.append(f"Host port {interface.host_port} is commonly used by {service}")
         
-        # Set overall validity
-        if results["errors"]:
-            results["is_valid"] = False
-        
-        return results
+        return {
+            "is_valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "suggestions": suggestions
+        }
     
-    def validate_vagrantfile_syntax(self, content: str) -> Dict[str, Any]:
+    def validate_vagrantfile_syntax(self, content: str) -> ValidationResult:
         """
         Validate Vagrantfile syntax (basic checks).
         
@@ -320,39 +433,89 @@ class ValidationService:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": [],
-            "suggestions": []
-        }
-        
         # Basic syntax checks
-        if not content.strip():
-            results["errors"].append("Vagrantfile content is empty")
-            results["is_valid"] = False
-            return results
+        stripped = content.strip()
+        if not stripped:
+            return {
+                "is_valid": False,
+                "errors": ["Vagrantfile content is empty"],
+                "warnings": [],
+                "suggestions": []
+            }
+        
+        errors: List[str] = []
+        warnings: List[str] = []
+        suggestions: List[str] = []
+        
+        scan = _scan_vagrantfile(stripped)
         
         # Check for required structure
-        if "Vagrant.configure" not in content:
-            results["errors"].append("Vagrantfile missing Vagrant.configure block")
+        if not scan["saw_configure"]:
+            errors.append("Vagrantfile missing Vagrant.configure block")
         
-        if "config.vm.define" not in content and "config.vm.box" not in content:
-            results["warnings"].append("No VM definitions found in Vagrantfile")
+        if not scan["saw_vm_define"] and not scan["saw_vm_box"]:
+            warnings.append("No VM definitions found in Vagrantfile")
         
         # Check for common issues
-        if content.count('"') % 2 != 0:
-            results["errors"].append("Unmatched quotes in Vagrantfile")
+        if scan["quote_count"] % 2 != 0:
+            errors.append("Unmatched quotes in Vagrantfile")
         
-        if "end" not in content:
-            results["warnings"].append("No 'end' statements found - check block closures")
+        if not scan["saw_end"]:
+            warnings.append("No 'end' statements found - check block closures")
         
         # Check for best practices
-        if "config.vm.box" in content and "config.vm.box_version" not in content:
-            results["suggestions"].append("Consider pinning box versions for reproducibility")
-        
-        # Set overall validity
-        if results["errors"]:
-            results["is_valid"] = False
+        if scan["saw_vm_box"] and not scan["saw_box_version"]:
+            suggestions.append("Consider pinning box versions for reproducibility")
+        
+        return {
+            "is_valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "suggestions": suggestions
+        }
+
+
+def generation_validation_result(project: Project) -> Dict[str, Any]:
+    """
+    Validate a project with the rules applied before Vagrantfile generation.
+    
+    Shared by the single and batch validate endpoints so both report the
+    same result for the same project.
+    
+    Args:
+        project: Project instance to validate
         
-        return results
\ No newline at end of file
+    Returns:
+        Dictionary with validation results and VM/interface counts
+    """
+    is_valid, errors, warnings = project.validate_for_generation()
+    
+    return {
+        "is_valid": is_valid,
+        "errors": errors,
+        "warnings": warnings,
+        "vm_count": len(project.vms),
+        "network_interfaces_count": sum(len(vm.network_interfaces) for vm in project.vms)
+    }
+
+
+def validate_project_pure(project_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a project given as a plain dictionary.
+    
+    Module-level so it can be submitted to a ProcessPoolExecutor: only the
+    picklable project dict and the result cross the process boundary.
+    
+    The project is rebuilt without validation, exactly as ProjectService loads
+    it, so legacy projects get the same result as from the single endpoint.
+    
+    Args:
+        project_data: The project's stored JSON, as from ProjectService.get_project_data()
+        
+    Returns:
+        Dictionary with validation results, as from generation_validation_result()
+    """
+    # Imported here: project_service imports this module for generation_validation_result
+    from .project_service import project_from_stored_data
+    
+    return generation_validation_result(project_from_stored_data(project_data))
\ No newline at end of file
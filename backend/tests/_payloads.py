@@ -0,0 +1,6 @@
+"""
+Request payloads shared by the contract and integration tests.
+"""
+
+# Minimal VM body used as a precondition by the VM, interface and integration tests
+TEST_VM = {"name": "test-vm", "box": "ubuntu/jammy64"}
@@ -0,0 +1,61 @@
+"""
+Shared test configuration.
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+_session_data_dir = None
+_previous_data_dir = None
+
+
+def pytest_configure(config):
+    """Keep the whole run out of the real data directory, starting before collection.
+
+    Importing the services builds singletons that create their storage directories,
+    so DATA_DIR has to be redirected before any test module imports src.
+    """
+    global _session_data_dir, _previous_data_dir
+    _previous_data_dir = os.environ.get("DATA_DIR")
+    _session_data_dir = tempfile.mkdtemp(prefix="vagrantfile-generator-tests-")
+    os.environ["DATA_DIR"] = _session_data_dir
+
+
+def pytest_unconfigure(config):
+    if _previous_data_dir is None:
+        os.environ.pop("DATA_DIR", None)
+    else:
+        os.environ["DATA_DIR"] = _previous_data_dir
+    shutil.rmtree(_session_data_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def data_root(tmp_path, monkeypatch):
+    """Point the file-backed store at a fresh per-test directory."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Single TestClient for the whole suite; app startup and shutdown run once."""
+    # Imported here so collecting a -k subset does not load the whole app
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def project_factory(client):
+    """Return a function that creates a project and returns its JSON body."""
+    def create(name=None, **fields):
+        payload = {"name": name or f"project-{uuid.uuid4().hex[:8]}", **fields}
+        response = client.post("/api/projects", json=payload)
+        assert response.status_code == 201
+        return response.json()
+    return create
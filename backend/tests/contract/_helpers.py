@@ -0,0 +1,63 @@
+"""
+URL builders, request payloads and response helpers shared by the contract tests.
+"""
+
+import json
+import re
+
+PROJECTS_URL = "/api/projects"
+
+# Well-formed project id that is never assigned, for not-found paths
+MISSING_UUID = "00000000-0000-4000-8000-000000000000"
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# ISO 8601 timestamp as serialized by the API; the UTC offset is optional
+ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?")
+
+# Static request bodies, serialized once instead of on every request
+DHCP_INTERFACE = json.dumps({"type": "private_network", "ip_assignment": "dhcp"}).encode()
+
+# Full VM body for project PUTs; build payloads with make_vm rather than using it directly
+DEFAULT_VM = {
+    "box": "ubuntu/jammy64",
+    "memory": 1024,
+    "cpus": 1,
+    "network_interfaces": [],
+    "synced_folders": [],
+    "provisioners": [],
+    "plugins": []
+}
+
+
+def project_url(project_id):
+    return f"{PROJECTS_URL}/{project_id}"
+
+
+def vms_url(project_id):
+    return f"{PROJECTS_URL}/{project_id}/vms"
+
+
+def interface_url(project_id, vm, interface_id=""):
+    base = f"{PROJECTS_URL}/{project_id}/vms/{vm}/network-interfaces"
+    return f"{base}/{interface_id}" if interface_id else base
+
+
+def make_vm(name, **overrides):
+    """Return a VM payload named ``name`` with DEFAULT_VM settings; hostname only if passed."""
+    # Fresh lists per payload, so one test's edits never leak into DEFAULT_VM
+    defaults = {key: list(value) if isinstance(value, list) else value for key, value in DEFAULT_VM.items()}
+    return {**defaults, "name": name, **overrides}
+
+
+def assert_iso_datetime(value):
+    """Assert ``value`` is an ISO 8601 timestamp, rejecting obvious non-dates before the regex."""
+    assert isinstance(value, str) and len(value) >= 19 and value[4] == "-" and value[10] == "T", value
+    assert ISO_DATETIME.fullmatch(value), value
+
+
+def assert_json(response, status):
+    """Assert the status code and JSON content type, then return the decoded body."""
+    assert response.status_code == status
+    assert response.headers.get("content-type") == "application/json"
+    return response.json()
@@ -0,0 +1,96 @@
+"""
+Shared fixtures for contract tests.
+"""
+
+import copy
+
+import pytest
+
+from _helpers import interface_url, vms_url
+from _payloads import TEST_VM
+from src.models import DeploymentStatus, ProjectSummary
+from src.services import ProjectService, ProjectNotFoundError
+
+
+class InMemoryProjectService(ProjectService):
+    """ProjectService that keeps the stored project JSON in a dict instead of files."""
+
+    def __init__(self, store):
+        super().__init__()
+        self._store = store
+
+    def get_project_data(self, project_id):
+        try:
+            # Hand out copies so callers mutate and save, as with the file store
+            return copy.deepcopy(self._store[str(project_id)])
+        except KeyError:
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+
+    def _save_project_to_file(self, project):
+        self._store[str(project.id)] = project.model_dump(mode="json")
+
+    def delete_project(self, project_id):
+        if not self.project_exists(project_id):
+            return False
+        project = self._load_project_from_file(project_id)
+        if project.deployment_status == DeploymentStatus.READY:
+            raise ValueError(f"Cannot delete project '{project.name}' - project is locked in ready status")
+        del self._store[str(project_id)]
+        return True
+
+    def list_projects(self):
+        summaries = [
+            ProjectSummary.from_project(self._load_project_from_file(project_id))
+            for project_id in list(self._store)
+        ]
+        summaries.sort(key=lambda p: p.created_at, reverse=True)
+        return summaries
+
+    def project_exists(self, project_id):
+        return str(project_id) in self._store
+
+    def get_project_count(self):
+        return len(self._store)
+
+
+@pytest.fixture
+def project_store(client):
+    """Serve projects from an in-memory store for the duration of one test."""
+    # Imported here, like the app itself, so collection does not load the API modules
+    from src.api import generation, projects, vms
+
+    app = client.app
+    store = {}
+    dependencies = (projects.get_project_service, vms.get_project_service, generation.get_project_service)
+    for dependency in dependencies:
+        app.dependency_overrides[dependency] = lambda: InMemoryProjectService(store)
+    yield store
+    for dependency in dependencies:
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture
+def project_id(project_factory):
+    """Create an empty project and return its ID."""
+    return project_factory(description="")["id"]
+
+
+@pytest.fixture
+def vm(client, project_id):
+    """Add a VM named "test-vm" to the project and return it."""
+    response = client.post(vms_url(project_id), json=TEST_VM)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+def interface_id(client, project_id, vm):
+    """Add a static private network interface to "test-vm" and return its ID."""
+    interface_data = {
+        "type": "private_network",
+        "ip_assignment": "static",
+        "ip_address": "192.168.1.100"
+    }
+    response = client.post(interface_url(project_id, "test-vm"), json=interface_data)
+    assert response.status_code == 201
+    return response.json()["id"]
@@ -2,13 +2,8 @@
 Contract tests for POST /api/boxes
 """
 
-from fastapi.testclient import TestClient
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_create_box_minimal():
+def test_create_box_minimal(client):
     payload = {
         "name": "box-test",
         "description": "Box test",
@@ -6,19 +6,13 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import uuid
+from _helpers import MISSING_UUID
 
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_generate_vagrantfile_success():
+def test_generate_vagrantfile_success(client, project_factory):
     """Test successful Vagrantfile generation."""
     # Arrange - Create project with VMs
-    create_project = client.post("/api/projects", json={"name": "generation-test"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("generation-test")["id"]
     
     # Add VM to project
     vm_data = {
@@ -56,11 +50,10 @@ def test_generate_vagrantfile_success():
     assert isinstance(validation["warnings"], list)
 
 
-def test_generate_vagrantfile_empty_project():
+def test_generate_vagrantfile_empty_project(client, project_factory):
     """Test generating Vagrantfile for project with no VMs."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "empty-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("empty-project")["id"]
     
     # Act
     response = client.post(f"/api/projects/{project_id}/generate")
@@ -75,10 +68,10 @@ def test_generate_vagrantfile_empty_project():
         assert len(data["validation"]["errors"]) > 0
 
 
-def test_generate_vagrantfile_project_not_found():
+def test_generate_vagrantfile_project_not_found(client):
     """Test generating Vagrantfile for non-existent project."""
     # Arrange
-    fake_project_id = str(uuid.uuid4())
+    fake_project_id = MISSING_UUID
     
     # Act
     response = client.post(f"/api/projects/{fake_project_id}/generate")
@@ -87,11 +80,10 @@ def test_generate_vagrantfile_project_not_found():
     assert response.status_code == 404
 
 
-def test_generate_vagrantfile_contains_vm_config():
+def test_generate_vagrantfile_contains_vm_config(client, project_factory):
     """Test that generated Vagrantfile contains VM configuration."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "vm-config-test"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-config-test")["id"]
     
     vm_data = {
         "name": "test-vm",
@@ -119,11 +111,11 @@ def test_generate_vagrantfile_contains_vm_config():
     assert "4" in content
 
 
-def test_generate_vagrantfile_multiple_vms():
+def test_generate_vagrantfile_multiple_vms(client, project_factory):
     """Test generating Vagrantfile with multiple VMs."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "multi-vm-test"})
-    project_id = create_project.json()["id"]
+    project = project_factory("multi-vm-test")
+    project_id = project["id"]
     
     vms = [
         {"name": "web", "box": "ubuntu/jammy64", "memory": 2048, "cpus": 2},
@@ -131,9 +123,10 @@ def test_generate_vagrantfile_multiple_vms():
         {"name": "cache", "box": "centos/7", "memory": 1024, "cpus": 1}
     ]
     
-    for vm_data in vms:
-        create_vm = client.post(f"/api/projects/{project_id}/vms", json=vm_data)
-        assert create_vm.status_code == 201
+    # Add all VMs in a single project update
+    project["vms"] = vms
+    update_project = client.put(f"/api/projects/{project_id}", json=project)
+    assert update_project.status_code == 200
     
     # Act
     response = client.post(f"/api/projects/{project_id}/generate")
@@ -0,0 +1,39 @@
+"""
+Contract tests for project ID path validation.
+
+These tests verify that every project-scoped endpoint rejects malformed project IDs.
+"""
+
+import pytest
+from _helpers import interface_url, project_url
+
+
+@pytest.mark.parametrize("method,url_template,body", [
+    ("GET", project_url("{id}"), None),
+    ("PUT", project_url("{id}"), {"name": "test", "description": "", "version": "1.0.0", "vms": [], "global_plugins": []}),
+    ("DELETE", project_url("{id}"), None),
+    ("POST", interface_url("{id}", "test-vm"), {"type": "private_network", "ip_assignment": "dhcp"}),
+    ("PUT", interface_url("{id}", "test-vm", "interface-1"), {"ip_address": "192.168.1.200"}),
+    ("DELETE", interface_url("{id}", "test-vm", "interface-1"), None),
+])
+@pytest.mark.parametrize("invalid_id", [
+    "not-a-uuid",
+    "123",
+    "",
+    "invalid-uuid-format",
+    "12345678-1234-1234-1234-123456789abc-extra"
+])
+def test_invalid_project_id(request, client, method, url_template, body, invalid_id):
+    """Test that a malformed project ID is rejected before reaching the handler."""
+    if invalid_id == "" and url_template == project_url("{id}"):
+        request.applymarker(pytest.mark.xfail(
+            reason="an empty id turns the URL into the /api/projects list route (redirect or 405)",
+            strict=True
+        ))
+    response = client.request(method, url_template.format(id=invalid_id), json=body)
+
+    # Should be 422 (validation error) or 404 depending on FastAPI path validation
+    assert response.status_code in [404, 422]
+    assert response.headers["content-type"] == "application/json"
+    if response.status_code == 422:
+        assert response.json()["error"] == "Validation error"
@@ -5,37 +5,22 @@ These tests verify the API contract for adding network interfaces to VMs.
 """
 
 import pytest
-import uuid
-from fastapi.testclient import TestClient
-from src.main import app
+from _helpers import DHCP_INTERFACE, JSON_HEADERS, MISSING_UUID, PROJECTS_URL, assert_json, interface_url, project_url, vms_url
+from _payloads import TEST_VM
 
-client = TestClient(app)
 
+pytestmark = pytest.mark.usefixtures("project_store")
 
-@pytest.fixture(autouse=True)
-def clean_data():
-    """Clean test data before each test."""
-    import shutil
-    import os
-    data_dir = "data"
-    if os.path.exists(data_dir):
-        try:
-            shutil.rmtree(data_dir)
-        except OSError:
-            # Handle case where directory is busy (in containers)
-            pass
 
-
-def test_add_network_interface_success():
+def test_add_network_interface_success(client):
     """Test successfully adding a network interface to a VM."""
     # Create a project
     project_data = {
         "name": "network-test-project",
         "description": "Test project for network interfaces"
     }
-    create_response = client.post("/api/projects", json=project_data)
-    assert create_response.status_code == 201
-    project = create_response.json()
+    create_response = client.post(PROJECTS_URL, json=project_data)
+    project = assert_json(create_response, 201)
     project_id = project["id"]
     
     # Add a VM
@@ -45,7 +30,7 @@ def test_add_network_interface_success():
         "memory": 2048,
         "cpus": 2
     }
-    vm_response = client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    vm_response = client.post(vms_url(project_id), json=vm_data)
     assert vm_response.status_code == 201
     
     # Add network interface
@@ -56,165 +41,76 @@ def test_add_network_interface_success():
         "netmask": "255.255.255.0"
     }
     
-    response = client.post(
-        f"/api/projects/{project_id}/vms/web-server/network-interfaces",
-        json=interface_data
-    )
-    
-    assert response.status_code == 201
-    assert response.headers.get("content-type") == "application/json"
+    response = client.post(interface_url(project_id, "web-server"), json=interface_data)
     
-    data = response.json()
+    data = assert_json(response, 201)
     assert "type" in data
     assert data["type"] == "private_network"
     assert "ip_address" in data
     assert data["ip_address"] == "192.168.1.100"
 
 
-def test_add_network_interface_dhcp():
+def test_add_network_interface_dhcp(client, project_factory):
     """Test adding a DHCP network interface."""
     # Create project and VM
-    project_data = {"name": "dhcp-test", "description": ""}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("dhcp-test", description="")["id"]
     
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    client.post(vms_url(project_id), json=TEST_VM)
     
     # Add DHCP interface
-    interface_data = {
-        "type": "private_network",
-        "ip_assignment": "dhcp"
-    }
+    response = client.post(interface_url(project_id, "test-vm"), content=DHCP_INTERFACE, headers=JSON_HEADERS)
     
-    response = client.post(
-        f"/api/projects/{project_id}/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
-    
-    assert response.status_code == 201
-    data = response.json()
+    data = assert_json(response, 201)
     assert data["ip_assignment"] == "dhcp"
     assert data["ip_address"] is None
 
 
-def test_add_network_interface_project_not_found():
+def test_add_network_interface_project_not_found(client):
     """Test adding interface to non-existent project."""
-    fake_uuid = str(uuid.uuid4())
-    interface_data = {
-        "type": "private_network",
-        "ip_assignment": "dhcp"
-    }
+    response = client.post(interface_url(MISSING_UUID, "test-vm"), content=DHCP_INTERFACE, headers=JSON_HEADERS)
     
-    response = client.post(
-        f"/api/projects/{fake_uuid}/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
-    
-    assert response.status_code == 404
-    error_data = response.json()
+    error_data = assert_json(response, 404)
     assert "detail" in error_data
 
 
-def test_add_network_interface_vm_not_found():
+def test_add_network_interface_vm_not_found(client, project_factory):
     """Test adding interface to non-existent VM."""
     # Create project but no VM
-    project_data = {"name": "no-vm-project", "description": ""}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
-    
-    interface_data = {
-        "type": "private_network",
-        "ip_assignment": "dhcp"
-    }
+    project_id = project_factory("no-vm-project", description="")["id"]
     
-    response = client.post(
-        f"/api/projects/{project_id}/vms/non-existent-vm/network-interfaces",
-        json=interface_data
-    )
+    response = client.post(interface_url(project_id, "non-existent-vm"), content=DHCP_INTERFACE, headers=JSON_HEADERS)
     
-    assert response.status_code == 404
-    error_data = response.json()
+    error_data = assert_json(response, 404)
     assert "detail" in error_data
     assert "VM 'non-existent-vm' not found" in error_data["detail"]
 
 
-def test_add_network_interface_invalid_data():
+def test_add_network_interface_invalid_data(client, project_factory):
     """Test adding interface with invalid data."""
     # Create project and VM
-    project_data = {"name": "invalid-test", "description": ""}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("invalid-test", description="")["id"]
     
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    client.post(vms_url(project_id), json=TEST_VM)
     
     # Invalid interface data (missing required fields)
     interface_data = {
         "invalid_field": "value"
     }
     
-    response = client.post(
-        f"/api/projects/{project_id}/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
-    
-    assert response.status_code == 422  # FastAPI validation error
-    error_data = response.json()
-    assert "detail" in error_data
-
-
-def test_add_network_interface_invalid_project_id():
-    """Test adding interface with invalid project ID format."""
-    interface_data = {
-        "type": "private_network",
-        "ip_assignment": "dhcp"
-    }
-    
-    response = client.post(
-        "/api/projects/invalid-uuid/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
-    
-    assert response.status_code == 422  # FastAPI path validation
-    error_data = response.json()
-    assert "detail" in error_data
-
-
-def test_add_network_interface_response_headers():
-    """Test that response has correct headers."""
-    # Create project and VM
-    project_data = {"name": "headers-test", "description": ""}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
-    
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    client.post(f"/api/projects/{project_id}/vms", json=vm_data)
-    
-    interface_data = {
-        "type": "private_network",
-        "ip_assignment": "dhcp"
-    }
-    
-    response = client.post(
-        f"/api/projects/{project_id}/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
+    response = client.post(interface_url(project_id, "test-vm"), json=interface_data)
     
-    assert response.status_code == 201
-    assert "content-type" in response.headers
-    assert response.headers["content-type"] == "application/json"
+    error_data = assert_json(response, 422)  # FastAPI validation error
+    assert error_data["error"] == "Validation error"
+    assert error_data["details"]
 
 
-def test_add_network_interface_updates_project():
+@pytest.mark.slow
+def test_add_network_interface_updates_project(client, project_factory):
     """Test that adding interface updates the project."""
     # Create project and VM
-    project_data = {"name": "update-test", "description": ""}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("update-test", description="")["id"]
     
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    client.post(vms_url(project_id), json=TEST_VM)
     
     # Add interface
     interface_data = {
@@ -223,15 +119,11 @@ def test_add_network_interface_updates_project():
         "ip_address": "192.168.1.50"
     }
     
-    client.post(
-        f"/api/projects/{project_id}/vms/test-vm/network-interfaces",
-        json=interface_data
-    )
+    client.post(interface_url(project_id, "test-vm"), json=interface_data)
     
     # Verify project was updated
-    project_response = client.get(f"/api/projects/{project_id}")
-    assert project_response.status_code == 200
-    project = project_response.json()
+    project_response = client.get(project_url(project_id))
+    project = assert_json(project_response, 200)
     
     vm = project["vms"][0]
     assert len(vm["network_interfaces"]) == 1
@@ -3,13 +3,9 @@ Contract tests for POST /api/plugins
 """
 
 from datetime import datetime
-from fastapi.testclient import TestClient
-from src.main import app
 
-client = TestClient(app)
 
-
-def test_create_plugin_minimal():
+def test_create_plugin_minimal(client):
     payload = {
         "name": "plugin-test",
         "description": "Just a test"
@@ -26,7 +22,7 @@ def test_create_plugin_minimal():
     assert data.get("owner_id") is None
 
 
-def test_create_plugin_with_configuration():
+def test_create_plugin_with_configuration(client):
     payload = {
         "name": "plugin-test-2",
         "configuration": "puts 'hello'"
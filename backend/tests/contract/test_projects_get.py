@@ -6,25 +6,35 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
-import uuid
+from _helpers import MISSING_UUID, assert_iso_datetime
 
-from src.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def data_root(tmp_path_factory):
+    """Keep one data root for the whole module so the seeded project survives."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATA_DIR", str(tmp_path_factory.mktemp("data")))
+        yield
 
 
-def test_get_project_success():
-    """Test successful project retrieval."""
-    # Arrange - First create a project
+@pytest.fixture(scope="module")
+def seeded_project(client, data_root):
+    """Create one read-only project shared by the GET tests in this module."""
     create_data = {
         "name": "test-project",
         "description": "A test project"
     }
     create_response = client.post("/api/projects", json=create_data)
     assert create_response.status_code == 201
-    project_id = create_response.json()["id"]
+    project = create_response.json()
+    yield project
+    client.delete(f"/api/projects/{project['id']}")
+
+
+def test_get_project_success(client, seeded_project):
+    """Test successful project retrieval."""
+    # Arrange
+    project_id = seeded_project["id"]
     
     # Act
     response = client.get(f"/api/projects/{project_id}")
@@ -34,7 +44,7 @@ def test_get_project_success():
     
     data = response.json()
     assert data["id"] == project_id
-    assert data["name"] == "test-project"
+    assert data["name"] == seeded_project["name"]
     assert data["description"] == "A test project"
     assert data["version"] == "1.0.0"
     assert "created_at" in data
@@ -43,19 +53,17 @@ def test_get_project_success():
     assert isinstance(data["global_plugins"], list)
     
     # Validate datetime format
-    datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))
-    datetime.fromisoformat(data["updated_at"].replace('Z', '+00:00'))
+    assert_iso_datetime(data["created_at"])
+    assert_iso_datetime(data["updated_at"])
 
 
-def test_get_project_with_vms():
+def test_get_project_with_vms(client, seeded_project):
     """Test project retrieval with VMs."""
     # This test will be more meaningful once VM creation is implemented
     # For now, just test the structure
     
-    # Arrange - Create a project
-    create_data = {"name": "project-with-vms"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    # Arrange
+    project_id = seeded_project["id"]
     
     # Act
     response = client.get(f"/api/projects/{project_id}")
@@ -84,10 +92,10 @@ def test_get_project_with_vms():
         assert isinstance(vm["plugins"], list)
 
 
-def test_get_project_not_found():
+def test_get_project_not_found(client):
     """Test retrieving non-existent project."""
     # Arrange
-    fake_id = str(uuid.uuid4())
+    fake_id = MISSING_UUID
     
     # Act
     response = client.get(f"/api/projects/{fake_id}")
@@ -98,34 +106,10 @@ def test_get_project_not_found():
     assert "error" in error_data
 
 
-def test_get_project_invalid_uuid():
-    """Test retrieving project with invalid UUID."""
-    # Arrange
-    invalid_ids = [
-        "not-a-uuid",
-        "123",
-        "",
-        "invalid-uuid-format"
-    ]
-    
-    for invalid_id in invalid_ids:
-        # Act
-        response = client.get(f"/api/projects/{invalid_id}")
-        
-        # Assert
-        # Should be 422 (validation error) or 404 depending on FastAPI path validation
-        assert response.status_code in [404, 422]
-
-
-def test_get_project_response_structure():
+def test_get_project_response_structure(client, seeded_project):
     """Test that the response has the exact required structure."""
     # Arrange
-    create_data = {
-        "name": "structure-test-project",
-        "description": "Testing response structure"
-    }
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = seeded_project["id"]
     
     # Act
     response = client.get(f"/api/projects/{project_id}")
@@ -153,12 +137,10 @@ def test_get_project_response_structure():
     assert isinstance(data["global_plugins"], list)
 
 
-def test_get_project_content_type():
+def test_get_project_content_type(client, seeded_project):
     """Test that the response has correct content type."""
     # Arrange
-    create_data = {"name": "content-type-test"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = seeded_project["id"]
     
     # Act
     response = client.get(f"/api/projects/{project_id}")
@@ -6,20 +6,37 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
-
-from src.main import app
-
-client = TestClient(app)
-
-
-def test_list_projects_empty():
+from _helpers import assert_iso_datetime, make_vm
+
+
+# Fields of a project in the list view and their JSON types
+PROJECT_SUMMARY_FIELDS = {
+    "id": str,
+    "name": str,
+    "description": str,
+    "created_at": str,
+    "updated_at": str,
+    "vm_count": int
+}
+
+# Read-only request data, built once per module
+PROJECTS_TO_CREATE = (
+    {"name": "project-alpha", "description": "First project"},
+    {"name": "project-beta", "description": "Second project"},
+    {"name": "project-gamma"}  # No description
+)
+
+# Expected vm_count per project name
+VM_COUNT_CASES = (
+    {"name": "no-vms-project", "vm_count": 0},
+    {"name": "one-vm-project", "vm_count": 1},
+    {"name": "three-vms-project", "vm_count": 3}
+)
+
+
+def test_list_projects_empty(client):
     """Test listing projects when no projects exist."""
-    # Note: This assumes a fresh start or cleaned database
-    # In a real implementation, this might need database cleanup
-    
-    # Act
+    # Act - every test starts from an empty data directory (see conftest.data_root)
     response = client.get("/api/projects")
     
     # Assert
@@ -27,20 +44,14 @@ def test_list_projects_empty():
     
     data = response.json()
     assert "projects" in data
-    assert isinstance(data["projects"], list)
+    assert data["projects"] == []
 
 
-def test_list_projects_with_data():
+def test_list_projects_with_data(client):
     """Test listing projects when projects exist."""
     # Arrange - Create some projects
-    projects_to_create = [
-        {"name": "project-alpha", "description": "First project"},
-        {"name": "project-beta", "description": "Second project"},
-        {"name": "project-gamma"}  # No description
-    ]
-    
     created_ids = []
-    for project_data in projects_to_create:
+    for project_data in PROJECTS_TO_CREATE:
         create_response = client.post("/api/projects", json=project_data)
         assert create_response.status_code == 201
         created_ids.append(create_response.json()["id"])
@@ -54,16 +65,14 @@ def test_list_projects_with_data():
     data = response.json()
     assert "projects" in data
     assert isinstance(data["projects"], list)
-    assert len(data["projects"]) >= 3  # At least the ones we created
+    assert len(data["projects"]) == 3
     
-    # Check that our created projects are in the list
-    project_names = [p["name"] for p in data["projects"]]
-    assert "project-alpha" in project_names
-    assert "project-beta" in project_names
-    assert "project-gamma" in project_names
+    # Check that exactly our created projects are in the list
+    project_names = {p["name"] for p in data["projects"]}
+    assert project_names == {"project-alpha", "project-beta", "project-gamma"}
 
 
-def test_list_projects_response_structure():
+def test_list_projects_response_structure(client):
     """Test that each project in the list has the correct structure."""
     # Arrange - Create a project with known data
     create_data = {
@@ -72,33 +81,13 @@ def test_list_projects_response_structure():
     }
     create_response = client.post("/api/projects", json=create_data)
     assert create_response.status_code == 201
-    project_id = create_response.json()["id"]
+    project_data = create_response.json()
+    project_id = project_data["id"]
     
     # Add VMs to the project to test vm_count
-    project_data = create_response.json()
     project_data["vms"] = [
-        {
-            "name": "vm1",
-            "box": "ubuntu/jammy64",
-            "hostname": "vm1",
-            "memory": 1024,
-            "cpus": 1,
-            "network_interfaces": [],
-            "synced_folders": [],
-            "provisioners": [],
-            "plugins": []
-        },
-        {
-            "name": "vm2",
-            "box": "ubuntu/focal64",
-            "hostname": "vm2",
-            "memory": 2048,
-            "cpus": 2,
-            "network_interfaces": [],
-            "synced_folders": [],
-            "provisioners": [],
-            "plugins": []
-        }
+        make_vm("vm1", hostname="vm1"),
+        make_vm("vm2", hostname="vm2", box="ubuntu/focal64", memory=2048, cpus=2)
     ]
     update_response = client.put(f"/api/projects/{project_id}", json=project_data)
     assert update_response.status_code == 200
@@ -110,29 +99,16 @@ def test_list_projects_response_structure():
     assert response.status_code == 200
     
     data = response.json()
-    project_list = data["projects"]
+    by_name = {project["name"]: project for project in data["projects"]}
     
     # Find our test project
-    test_project = None
-    for project in project_list:
-        if project["name"] == "structure-test-project":
-            test_project = project
-            break
-    
+    test_project = by_name.get("structure-test-project")
     assert test_project is not None
     
-    # Verify required fields in list view
-    required_fields = ["id", "name", "description", "created_at", "updated_at", "vm_count"]
-    for field in required_fields:
+    # Verify required fields and their types in list view
+    for field, field_type in PROJECT_SUMMARY_FIELDS.items():
         assert field in test_project, f"Missing required field: {field}"
-    
-    # Verify field types
-    assert isinstance(test_project["id"], str)
-    assert isinstance(test_project["name"], str)
-    assert isinstance(test_project["description"], str)
-    assert isinstance(test_project["created_at"], str)
-    assert isinstance(test_project["updated_at"], str)
-    assert isinstance(test_project["vm_count"], int)
+        assert isinstance(test_project[field], field_type), f"Wrong type for field: {field}"
     
     # Verify values
     assert test_project["name"] == "structure-test-project"
@@ -140,41 +116,24 @@ def test_list_projects_response_structure():
     assert test_project["vm_count"] == 2  # We added 2 VMs
     
     # Validate datetime format
-    datetime.fromisoformat(test_project["created_at"].replace('Z', '+00:00'))
-    datetime.fromisoformat(test_project["updated_at"].replace('Z', '+00:00'))
+    assert_iso_datetime(test_project["created_at"])
+    assert_iso_datetime(test_project["updated_at"])
 
 
-def test_list_projects_vm_count_accuracy():
+def test_list_projects_vm_count_accuracy(client):
     """Test that vm_count reflects the actual number of VMs."""
     # Arrange - Create projects with different VM counts
-    test_cases = [
-        {"name": "no-vms-project", "vm_count": 0},
-        {"name": "one-vm-project", "vm_count": 1},
-        {"name": "three-vms-project", "vm_count": 3}
-    ]
-    
-    for case in test_cases:
+    for case in VM_COUNT_CASES:
         # Create project
         create_response = client.post("/api/projects", json={"name": case["name"]})
-        project_id = create_response.json()["id"]
+        project_data = create_response.json()
+        project_id = project_data["id"]
         
         # Add the specified number of VMs
-        project_data = create_response.json()
         project_data["vms"] = []
         
         for i in range(case["vm_count"]):
-            vm = {
-                "name": f"vm{i+1}",
-                "box": "ubuntu/jammy64",
-                "hostname": f"vm{i+1}",
-                "memory": 1024,
-                "cpus": 1,
-                "network_interfaces": [],
-                "synced_folders": [],
-                "provisioners": [],
-                "plugins": []
-            }
-            project_data["vms"].append(vm)
+            project_data["vms"].append(make_vm(f"vm{i+1}", hostname=f"vm{i+1}"))
         
         if case["vm_count"] > 0:
             update_response = client.put(f"/api/projects/{project_id}", json=project_data)
@@ -187,17 +146,17 @@ def test_list_projects_vm_count_accuracy():
     assert response.status_code == 200
     
     data = response.json()
-    project_list = data["projects"]
+    by_name = {project["name"]: project for project in data["projects"]}
     
     # Verify VM counts
-    for case in test_cases:
-        project = next((p for p in project_list if p["name"] == case["name"]), None)
+    for case in VM_COUNT_CASES:
+        project = by_name.get(case["name"])
         assert project is not None
         assert project["vm_count"] == case["vm_count"]
 
 
-def test_list_projects_ordering():
-    """Test project list ordering (should be consistent)."""
+def test_list_projects_ordering(client):
+    """Test project list ordering (newest first)."""
     # Arrange - Create projects with known names
     project_names = ["zebra-project", "alpha-project", "beta-project"]
     
@@ -205,24 +164,21 @@ def test_list_projects_ordering():
         create_response = client.post("/api/projects", json={"name": name})
         assert create_response.status_code == 201
     
-    # Act - Get list multiple times
-    response1 = client.get("/api/projects")
-    response2 = client.get("/api/projects")
+    # Act
+    response = client.get("/api/projects")
     
     # Assert
-    assert response1.status_code == 200
-    assert response2.status_code == 200
+    assert response.status_code == 200
     
-    projects1 = response1.json()["projects"]
-    projects2 = response2.json()["projects"]
+    projects = response.json()["projects"]
+    assert {p["name"] for p in projects} == set(project_names)
     
-    # Order should be consistent between calls
-    names1 = [p["name"] for p in projects1]
-    names2 = [p["name"] for p in projects2]
-    assert names1 == names2
+    # Projects are sorted by creation date, newest first
+    created = [p["created_at"] for p in projects]
+    assert created == sorted(created, reverse=True)
 
 
-def test_list_projects_content_type():
+def test_list_projects_content_type(client):
     """Test that the response has correct content type."""
     # Act
     response = client.get("/api/projects")
@@ -232,50 +188,44 @@ def test_list_projects_content_type():
     assert "application/json" in response.headers.get("content-type", "")
 
 
-def test_list_projects_http_methods():
+def test_list_projects_http_methods(client):
     """Test that only GET method is allowed."""
-    # Test other HTTP methods should not work
-    wrong_methods = [
-        lambda: client.post("/api/projects", json={"name": "test"}),  # This is for creating, different endpoint
-        lambda: client.put("/api/projects"),
-        lambda: client.delete("/api/projects")
-    ]
+    methods = {
+        method
+        for route in client.app.routes
+        if getattr(route, "path", None) == "/api/projects"
+        for method in route.methods
+    }
     
     # PUT and DELETE should not be allowed on the list endpoint
-    response = client.put("/api/projects")
-    assert response.status_code in [404, 405]  # Method not allowed or not found
-    
-    response = client.delete("/api/projects")  
-    assert response.status_code in [404, 405]  # Method not allowed or not found
+    assert "GET" in methods
+    assert "PUT" not in methods
+    assert "DELETE" not in methods
 
 
-def test_list_projects_no_sensitive_data():
+def test_list_projects_no_sensitive_data(client):
     """Test that the list view doesn't expose sensitive or detailed data."""
     # Arrange - Create a project with detailed configuration
     create_data = {"name": "detailed-project", "description": "Has detailed config"}
     create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_data = create_response.json()
+    project_id = project_data["id"]
     
     # Add detailed VM configuration
-    project_data = create_response.json()
     project_data["vms"] = [
-        {
-            "name": "detailed-vm",
-            "box": "ubuntu/jammy64",
-            "hostname": "detailed",
-            "memory": 4096,
-            "cpus": 4,
-            "network_interfaces": [
+        make_vm(
+            "detailed-vm",
+            hostname="detailed",
+            memory=4096,
+            cpus=4,
+            network_interfaces=[
                 {
                     "type": "private_network",
                     "ip": "192.168.1.100",
                     "netmask": "255.255.255.0"
                 }
-            ],
-            "synced_folders": [],
-            "provisioners": [],
-            "plugins": []
-        }
+            ]
+        )
     ]
     update_response = client.put(f"/api/projects/{project_id}", json=project_data)
     assert update_response.status_code == 200
@@ -287,10 +237,8 @@ def test_list_projects_no_sensitive_data():
     assert response.status_code == 200
     
     data = response.json()
-    detailed_project = next(
-        (p for p in data["projects"] if p["name"] == "detailed-project"), 
-        None
-    )
+    by_name = {project["name"]: project for project in data["projects"]}
+    detailed_project = by_name.get("detailed-project")
     assert detailed_project is not None
     
     # List view should NOT include detailed VM configurations
@@ -299,6 +247,4 @@ def test_list_projects_no_sensitive_data():
     assert "version" not in detailed_project
     
     # Should only have summary information
-    expected_fields = {"id", "name", "description", "created_at", "updated_at", "vm_count"}
-    actual_fields = set(detailed_project.keys())
-    assert actual_fields == expected_fields
\ No newline at end of file
+    assert set(detailed_project) == set(PROJECT_SUMMARY_FIELDS)
\ No newline at end of file
@@ -6,16 +6,11 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
 import uuid
+from _helpers import assert_iso_datetime
 
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_create_project_success():
+def test_create_project_success(client):
     """Test successful project creation."""
     # Arrange
     request_data = {
@@ -46,11 +41,11 @@ def test_create_project_success():
     assert data["owner_id"] is None
     
     # Validate datetime format
-    datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))
-    datetime.fromisoformat(data["updated_at"].replace('Z', '+00:00'))
+    assert_iso_datetime(data["created_at"])
+    assert_iso_datetime(data["updated_at"])
 
 
-def test_create_project_minimal_data():
+def test_create_project_minimal_data(client):
     """Test project creation with minimal required data."""
     # Arrange
     request_data = {
@@ -68,27 +63,24 @@ def test_create_project_minimal_data():
     assert data["description"] == ""  # Default empty description
 
 
-def test_create_project_invalid_name():
+@pytest.mark.parametrize("request_data", [
+    {"name": ""},  # Empty name
+    {"name": None},  # Null name
+    {"name": "a" * 256},  # Too long name
+    {"name": "invalid/name"},  # Invalid characters
+    {}  # Missing name
+])
+def test_create_project_invalid_name(client, request_data):
     """Test project creation with invalid name."""
-    # Arrange
-    test_cases = [
-        {"name": ""},  # Empty name
-        {"name": None},  # Null name
-        {"name": "a" * 256},  # Too long name
-        {"name": "invalid/name"},  # Invalid characters
-        {}  # Missing name
-    ]
+    # Act
+    response = client.post("/api/projects", json=request_data)
     
-    for request_data in test_cases:
-        # Act
-        response = client.post("/api/projects", json=request_data)
-        
-        # Assert
-        assert response.status_code == 400
-        assert "error" in response.json()
+    # Assert
+    assert response.status_code == 400
+    assert "error" in response.json()
 
 
-def test_create_project_duplicate_name():
+def test_create_project_duplicate_name(client):
     """Test project creation with duplicate name."""
     # Arrange
     request_data = {
@@ -110,7 +102,7 @@ def test_create_project_duplicate_name():
     assert "already exists" in error_data["error"].lower()
 
 
-def test_create_project_invalid_json():
+def test_create_project_invalid_json(client):
     """Test project creation with invalid JSON."""
     # Act
     response = client.post(
@@ -123,7 +115,7 @@ def test_create_project_invalid_json():
     assert response.status_code == 422  # FastAPI validation error
 
 
-def test_create_project_extra_fields():
+def test_create_project_extra_fields(client):
     """Test project creation ignores extra fields."""
     # Arrange
     request_data = {
@@ -6,30 +6,15 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
-import uuid
+from _helpers import MISSING_UUID, assert_iso_datetime, make_vm
 
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_update_project_success():
+def test_update_project_success(client, project_factory):
     """Test successful project update."""
     # Arrange - Create a project first
-    create_data = {
-        "name": "original-project",
-        "description": "Original description"
-    }
-    create_response = client.post("/api/projects", json=create_data)
-    assert create_response.status_code == 201
-    project_id = create_response.json()["id"]
-    original_created_at = create_response.json()["created_at"]
-    
-    # Get the current project state to modify it
-    get_response = client.get(f"/api/projects/{project_id}")
-    project_data = get_response.json()
+    project_data = project_factory("original-project", description="Original description")
+    project_id = project_data["id"]
+    original_created_at = project_data["created_at"]
     
     # Modify the project data
     project_data["name"] = "updated-project"
@@ -50,15 +35,13 @@ def test_update_project_success():
     assert data["updated_at"] != original_created_at  # Should be updated
     
     # Validate datetime format
-    datetime.fromisoformat(data["updated_at"].replace('Z', '+00:00'))
+    assert_iso_datetime(data["updated_at"])
 
 
-def test_update_project_partial_data():
+def test_update_project_partial_data(client, project_factory):
     """Test updating project with partial data."""
     # Arrange
-    create_data = {"name": "partial-test", "description": "Original"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("partial-test", description="Original")["id"]
     
     # Act - Update only the description
     update_data = {
@@ -77,31 +60,17 @@ def test_update_project_partial_data():
     assert data["description"] == "Updated description only"
 
 
-def test_update_project_with_vms():
+def test_update_project_with_vms(client, project_factory):
     """Test updating project with VM configurations."""
     # Arrange
-    create_data = {"name": "vm-test-project"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("vm-test-project")["id"]
     
     # Act - Update with VM data
     update_data = {
         "name": "vm-test-project",
         "description": "",
         "version": "1.0.0",
-        "vms": [
-            {
-                "name": "web-server",
-                "box": "ubuntu/jammy64",
-                "hostname": "web",
-                "memory": 2048,
-                "cpus": 2,
-                "network_interfaces": [],
-                "synced_folders": [],
-                "provisioners": [],
-                "plugins": []
-            }
-        ],
+        "vms": [make_vm("web-server", hostname="web", memory=2048, cpus=2)],
         "global_plugins": []
     }
     response = client.put(f"/api/projects/{project_id}", json=update_data)
@@ -117,10 +86,10 @@ def test_update_project_with_vms():
     assert vm["cpus"] == 2
 
 
-def test_update_project_not_found():
+def test_update_project_not_found(client):
     """Test updating non-existent project."""
     # Arrange
-    fake_id = str(uuid.uuid4())
+    fake_id = MISSING_UUID
     update_data = {
         "name": "non-existent",
         "description": "Should not work",
@@ -138,38 +107,31 @@ def test_update_project_not_found():
     assert "error" in error_data
 
 
-def test_update_project_invalid_data():
+@pytest.mark.parametrize("update_data", [
+    {"name": ""},  # Empty name
+    {"name": None},  # Null name
+    {"name": "a" * 256},  # Too long name
+    {"vms": "not-a-list"},  # Invalid VMs format
+    {"global_plugins": "not-a-list"},  # Invalid plugins format
+    {"version": None},  # Invalid version
+    {}  # Missing required fields
+])
+def test_update_project_invalid_data(client, project_factory, update_data):
     """Test updating project with invalid data."""
     # Arrange - Create a project first
-    create_data = {"name": "validation-test"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("validation-test")["id"]
     
-    # Test cases with invalid data
-    invalid_updates = [
-        {"name": ""},  # Empty name
-        {"name": None},  # Null name
-        {"name": "a" * 256},  # Too long name
-        {"vms": "not-a-list"},  # Invalid VMs format
-        {"global_plugins": "not-a-list"},  # Invalid plugins format
-        {"version": None},  # Invalid version
-        {}  # Missing required fields
-    ]
+    # Act
+    response = client.put(f"/api/projects/{project_id}", json=update_data)
     
-    for update_data in invalid_updates:
-        # Act
-        response = client.put(f"/api/projects/{project_id}", json=update_data)
-        
-        # Assert
-        assert response.status_code == 400
+    # Assert
+    assert response.status_code == 400
 
 
-def test_update_project_invalid_vm_data():
+def test_update_project_invalid_vm_data(client, project_factory):
     """Test updating project with invalid VM data."""
     # Arrange
-    create_data = {"name": "invalid-vm-test"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("invalid-vm-test")["id"]
     
     # Invalid VM configurations
     invalid_vm_data = {
@@ -194,12 +156,10 @@ def test_update_project_invalid_vm_data():
     assert response.status_code == 400
 
 
-def test_update_project_duplicate_vm_names():
+def test_update_project_duplicate_vm_names(client, project_factory):
     """Test updating project with duplicate VM names."""
     # Arrange
-    create_data = {"name": "duplicate-vm-test"}
-    create_response = client.post("/api/projects", json=create_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("duplicate-vm-test")["id"]
     
     # Duplicate VM names
     duplicate_vm_data = {
@@ -207,26 +167,8 @@ def test_update_project_duplicate_vm_names():
         "description": "",
         "version": "1.0.0",
         "vms": [
-            {
-                "name": "same-name",
-                "box": "ubuntu/jammy64",
-                "memory": 1024,
-                "cpus": 1,
-                "network_interfaces": [],
-                "synced_folders": [],
-                "provisioners": [],
-                "plugins": []
-            },
-            {
-                "name": "same-name",  # Duplicate name
-                "box": "ubuntu/focal64",
-                "memory": 2048,
-                "cpus": 2,
-                "network_interfaces": [],
-                "synced_folders": [],
-                "provisioners": [],
-                "plugins": []
-            }
+            make_vm("same-name"),
+            make_vm("same-name", box="ubuntu/focal64", memory=2048, cpus=2)  # Duplicate name
         ],
         "global_plugins": []
     }
@@ -237,25 +179,4 @@ def test_update_project_duplicate_vm_names():
     # Assert
     assert response.status_code == 400
     error_data = response.json()
-    assert "duplicate" in error_data["error"].lower() or "unique" in error_data["error"].lower()
-
-
-def test_update_project_invalid_uuid():
-    """Test updating project with invalid UUID."""
-    # Arrange
-    update_data = {
-        "name": "test",
-        "description": "",
-        "version": "1.0.0",
-        "vms": [],
-        "global_plugins": []
-    }
-    
-    invalid_ids = ["not-a-uuid", "123", ""]
-    
-    for invalid_id in invalid_ids:
-        # Act
-        response = client.put(f"/api/projects/{invalid_id}", json=update_data)
-        
-        # Assert
-        assert response.status_code in [404, 422]  # Depends on FastAPI path validation
\ No newline at end of file
+    assert "duplicate" in error_data["error"].lower() or "unique" in error_data["error"].lower()
\ No newline at end of file
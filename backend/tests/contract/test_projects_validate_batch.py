@@ -0,0 +1,101 @@
+"""
+Contract tests for POST /api/projects/validate endpoint.
+
+These tests verify the API contract for validating several projects at once.
+"""
+
+import json
+
+from _helpers import MISSING_UUID
+
+
+def _create_project(client, name, vms):
+    response = client.post("/api/projects", json={"name": name, "description": "Batch validation"})
+    assert response.status_code == 201
+    project = response.json()
+    project["vms"] = vms
+    response = client.put(f"/api/projects/{project['id']}", json=project)
+    assert response.status_code == 200
+    return project["id"]
+
+
+def _stored_project_path(data_dir, project_id):
+    return data_dir / "shared" / "projects" / f"{project_id}.json"
+
+
+def test_validate_projects_returns_result_per_project(client):
+    """Test that each requested project gets its own validation result, in order."""
+    good_id = _create_project(client, "My Web Stack", [{"name": "web", "box": "ubuntu/jammy64", "hostname": "web"}])
+    empty_id = _create_project(client, "batch-empty", [])
+
+    response = client.post("/api/projects/validate", json={"project_ids": [good_id, empty_id]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["project_id"] for result in results] == [good_id, empty_id]
+    assert results[0]["is_valid"] is True
+    assert results[1]["is_valid"] is False
+    assert "Project must have at least one virtual machine" in results[1]["errors"]
+
+
+def test_validate_projects_matches_single_validation(client):
+    """Test that a batch result is identical to validating each project on its own."""
+    project_ids = [
+        _create_project(client, "My Web Stack", [{"name": "web", "box": "ubuntu/jammy64", "memory": 512}]),
+        _create_project(client, "batch-empty", []),
+    ]
+
+    response = client.post("/api/projects/validate", json={"project_ids": project_ids})
+
+    assert response.status_code == 200
+    singles = [client.post(f"/api/projects/{project_id}/validate") for project_id in project_ids]
+    assert response.json()["results"] == [
+        {"project_id": project_id, **single.json()} for project_id, single in zip(project_ids, singles)
+    ]
+
+
+def test_validate_projects_legacy_project(client, tmp_path):
+    """Test that a stored project the current model would reject validates like the single endpoint."""
+    project_id = _create_project(client, "legacy-project", [{"name": "web", "box": "ubuntu/jammy64"}])
+    # Legacy data written before VM names had to be unique
+    path = _stored_project_path(tmp_path, project_id)
+    stored = json.loads(path.read_text())
+    stored["vms"].append({**stored["vms"][0], "box": "ubuntu/focal64"})
+    path.write_text(json.dumps(stored))
+
+    single = client.post(f"/api/projects/{project_id}/validate")
+    response = client.post("/api/projects/validate", json={"project_ids": [project_id]})
+
+    assert single.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["results"] == [{"project_id": project_id, **single.json()}]
+
+
+def test_validate_projects_unreadable_project(client, tmp_path):
+    """Test that a corrupt project file fails its own entry without failing the batch."""
+    good_id = _create_project(client, "batch-good", [{"name": "web", "box": "ubuntu/jammy64"}])
+    broken_id = _create_project(client, "batch-broken", [])
+    _stored_project_path(tmp_path, broken_id).write_text("{not json")
+
+    response = client.post("/api/projects/validate", json={"project_ids": [good_id, broken_id]})
+
+    assert response.status_code == 200
+    good, broken = response.json()["results"]
+    assert good["is_valid"] is True
+    assert broken["project_id"] == broken_id
+    assert broken["is_valid"] is False
+    assert broken["errors"][0].startswith("Validation failed: Invalid project data")
+
+
+def test_validate_projects_unknown_project(client):
+    """Test that an unknown project ID fails the whole batch with 404."""
+    response = client.post("/api/projects/validate", json={"project_ids": [MISSING_UUID]})
+
+    assert response.status_code == 404
+
+
+def test_validate_projects_invalid_id(client):
+    """Test that malformed project IDs are rejected."""
+    response = client.post("/api/projects/validate", json={"project_ids": ["not-a-uuid"]})
+
+    assert response.status_code == 422
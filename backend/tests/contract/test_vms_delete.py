@@ -6,19 +6,13 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import uuid
+from _helpers import MISSING_UUID
 
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_delete_vm_success():
+def test_delete_vm_success(client, project_factory):
     """Test successful VM deletion."""
     # Arrange - Create project and VM
-    create_project = client.post("/api/projects", json={"name": "vm-delete-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-delete-project")["id"]
     
     vm_data = {
         "name": "vm-to-delete",
@@ -44,11 +38,10 @@ def test_delete_vm_success():
     assert len(updated_project.json()["vms"]) == 0
 
 
-def test_delete_vm_not_found():
+def test_delete_vm_not_found(client, project_factory):
     """Test deleting non-existent VM."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "vm-not-found-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-not-found-project")["id"]
     
     # Act
     response = client.delete(f"/api/projects/{project_id}/vms/non-existent-vm")
@@ -57,10 +50,10 @@ def test_delete_vm_not_found():
     assert response.status_code == 404
 
 
-def test_delete_vm_project_not_found():
+def test_delete_vm_project_not_found(client):
     """Test deleting VM from non-existent project."""
     # Arrange
-    fake_project_id = str(uuid.uuid4())
+    fake_project_id = MISSING_UUID
     
     # Act
     response = client.delete(f"/api/projects/{fake_project_id}/vms/some-vm")
@@ -69,18 +62,16 @@ def test_delete_vm_project_not_found():
     assert response.status_code == 404
 
 
-def test_delete_vm_multiple_vms():
+def test_delete_vm_multiple_vms(client, project_factory):
     """Test deleting one VM when project has multiple VMs."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "multi-vm-project"})
-    project_id = create_project.json()["id"]
-    
-    # Create multiple VMs
-    vm_names = ["vm1", "vm2", "vm3"]
-    for vm_name in vm_names:
-        vm_data = {"name": vm_name, "box": "ubuntu/jammy64"}
-        create_vm = client.post(f"/api/projects/{project_id}/vms", json=vm_data)
-        assert create_vm.status_code == 201
+    project = project_factory("multi-vm-project")
+    project_id = project["id"]
+    
+    # Create multiple VMs in a single project update
+    project["vms"] = [{"name": vm_name, "box": "ubuntu/jammy64"} for vm_name in ["vm1", "vm2", "vm3"]]
+    update_project = client.put(f"/api/projects/{project_id}", json=project)
+    assert update_project.status_code == 200
     
     # Verify all VMs exist
     get_project = client.get(f"/api/projects/{project_id}")
@@ -6,20 +6,29 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import uuid
-
-from src.main import app
-
-client = TestClient(app)
-
-
-def test_add_vm_success():
+from _helpers import MISSING_UUID
+from _payloads import TEST_VM
+
+
+# Read-only request data, built once per module
+INVALID_VM_DATA = (
+    {"name": "", "box": "ubuntu/jammy64"},  # Empty name
+    {"name": None, "box": "ubuntu/jammy64"},  # Null name
+    {"name": "test-vm", "box": ""},  # Empty box
+    {"name": "test-vm", "box": None},  # Null box
+    {"name": "test-vm"},  # Missing box
+    {"box": "ubuntu/jammy64"},  # Missing name
+    {"name": "test-vm", "box": "ubuntu/jammy64", "memory": -1},  # Invalid memory
+    {"name": "test-vm", "box": "ubuntu/jammy64", "cpus": 0},  # Invalid cpus
+    {"name": "test-vm", "box": "ubuntu/jammy64", "memory": "not-a-number"},  # Invalid memory type
+    {}  # Empty object
+)
+
+
+def test_add_vm_success(client, project_factory):
     """Test successful VM addition to project."""
     # Arrange - Create a project first
-    create_project = client.post("/api/projects", json={"name": "vm-test-project"})
-    assert create_project.status_code == 201
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-test-project")["id"]
     
     vm_data = {
         "name": "web-server",
@@ -36,22 +45,20 @@ def test_add_vm_success():
     assert response.status_code == 201
     
     data = response.json()
-    assert data["name"] == "web-server"
-    assert data["box"] == "ubuntu/jammy64"
-    assert data["hostname"] == "web"
-    assert data["memory"] == 2048
-    assert data["cpus"] == 2
-    assert data["network_interfaces"] == []
-    assert data["synced_folders"] == []
-    assert data["provisioners"] == []
-    assert data["plugins"] == []
+    expected = {
+        **vm_data,
+        "network_interfaces": [],
+        "synced_folders": [],
+        "provisioners": [],
+        "plugins": []
+    }
+    assert {key: data[key] for key in expected} == expected
 
 
-def test_add_vm_minimal_data():
+def test_add_vm_minimal_data(client, project_factory):
     """Test VM addition with minimal required data."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "minimal-vm-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("minimal-vm-project")["id"]
     
     vm_data = {
         "name": "minimal-vm",
@@ -73,27 +80,22 @@ def test_add_vm_minimal_data():
     assert data["cpus"] == 1  # Default cpus
 
 
-def test_add_vm_project_not_found():
+def test_add_vm_project_not_found(client):
     """Test adding VM to non-existent project."""
     # Arrange
-    fake_project_id = str(uuid.uuid4())
-    vm_data = {
-        "name": "test-vm",
-        "box": "ubuntu/jammy64"
-    }
+    fake_project_id = MISSING_UUID
     
     # Act
-    response = client.post(f"/api/projects/{fake_project_id}/vms", json=vm_data)
+    response = client.post(f"/api/projects/{fake_project_id}/vms", json=TEST_VM)
     
     # Assert
     assert response.status_code == 404
 
 
-def test_add_vm_duplicate_name():
+def test_add_vm_duplicate_name(client, project_factory):
     """Test adding VM with duplicate name in same project."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "duplicate-vm-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("duplicate-vm-project")["id"]
     
     vm_data = {
         "name": "duplicate-vm",
@@ -111,59 +113,37 @@ def test_add_vm_duplicate_name():
     assert response2.status_code == 409
 
 
-def test_add_vm_invalid_data():
+@pytest.mark.parametrize("invalid_data", INVALID_VM_DATA)
+def test_add_vm_invalid_data(client, project_factory, invalid_data):
     """Test adding VM with invalid data."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "invalid-vm-project"})
-    project_id = create_project.json()["id"]
-    
-    invalid_data_cases = [
-        {"name": "", "box": "ubuntu/jammy64"},  # Empty name
-        {"name": None, "box": "ubuntu/jammy64"},  # Null name
-        {"name": "test-vm", "box": ""},  # Empty box
-        {"name": "test-vm", "box": None},  # Null box
-        {"name": "test-vm"},  # Missing box
-        {"box": "ubuntu/jammy64"},  # Missing name
-        {"name": "test-vm", "box": "ubuntu/jammy64", "memory": -1},  # Invalid memory
-        {"name": "test-vm", "box": "ubuntu/jammy64", "cpus": 0},  # Invalid cpus
-        {"name": "test-vm", "box": "ubuntu/jammy64", "memory": "not-a-number"},  # Invalid memory type
-        {}  # Empty object
-    ]
-    
-    for invalid_data in invalid_data_cases:
-        # Act
-        response = client.post(f"/api/projects/{project_id}/vms", json=invalid_data)
-        
-        # Assert
-        assert response.status_code == 400
-
-
-def test_add_vm_invalid_project_id():
-    """Test adding VM with invalid project ID."""
-    vm_data = {
-        "name": "test-vm",
-        "box": "ubuntu/jammy64"
-    }
+    project_id = project_factory("invalid-vm-project")["id"]
     
-    invalid_ids = ["not-a-uuid", "123", ""]
+    # Act
+    response = client.post(f"/api/projects/{project_id}/vms", json=invalid_data)
+    
+    # Assert
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("invalid_id", ["not-a-uuid", "123", ""], ids=["not-a-uuid", "numeric", "empty"])
+def test_add_vm_invalid_project_id(client, invalid_id):
+    """Test adding VM with invalid project ID."""
+    # Act
+    response = client.post(f"/api/projects/{invalid_id}/vms", json=TEST_VM)
     
-    for invalid_id in invalid_ids:
-        # Act
-        response = client.post(f"/api/projects/{invalid_id}/vms", json=vm_data)
-        
-        # Assert
-        assert response.status_code in [404, 422]  # Depends on FastAPI path validation
+    # Assert
+    assert response.status_code in [404, 422]  # Depends on FastAPI path validation
 
 
-def test_add_vm_updates_project():
+def test_add_vm_updates_project(client, project_factory):
     """Test that adding a VM updates the project's VM list."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "update-test-project"})
-    project_id = create_project.json()["id"]
+    project = project_factory("update-test-project")
+    project_id = project["id"]
     
     # Verify project initially has no VMs
-    get_project = client.get(f"/api/projects/{project_id}")
-    assert len(get_project.json()["vms"]) == 0
+    assert len(project["vms"]) == 0
     
     vm_data = {
         "name": "new-vm",
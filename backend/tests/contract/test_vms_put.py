@@ -6,19 +6,24 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import uuid
+from _helpers import MISSING_UUID
+from _payloads import TEST_VM
 
-from src.main import app
 
-client = TestClient(app)
+# Read-only request data, built once per module
+INVALID_VM_UPDATES = (
+    {"name": "", "box": "ubuntu/jammy64"},  # Empty name
+    {"name": "test-vm", "box": ""},  # Empty box
+    {"name": "test-vm", "box": "ubuntu/jammy64", "memory": -1},  # Invalid memory
+    {"name": "test-vm", "box": "ubuntu/jammy64", "cpus": 0},  # Invalid cpus
+    {}  # Empty object
+)
 
 
-def test_update_vm_success():
+def test_update_vm_success(client, project_factory):
     """Test successful VM update."""
     # Arrange - Create project and VM
-    create_project = client.post("/api/projects", json={"name": "vm-update-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-update-project")["id"]
     
     vm_data = {
         "name": "test-vm",
@@ -53,11 +58,10 @@ def test_update_vm_success():
     assert data["cpus"] == 2
 
 
-def test_update_vm_not_found():
+def test_update_vm_not_found(client, project_factory):
     """Test updating non-existent VM."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "vm-not-found-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("vm-not-found-project")["id"]
     
     vm_data = {
         "name": "non-existent-vm",
@@ -71,44 +75,30 @@ def test_update_vm_not_found():
     assert response.status_code == 404
 
 
-def test_update_vm_project_not_found():
+def test_update_vm_project_not_found(client):
     """Test updating VM in non-existent project."""
     # Arrange
-    fake_project_id = str(uuid.uuid4())
-    vm_data = {
-        "name": "test-vm",
-        "box": "ubuntu/jammy64"
-    }
+    fake_project_id = MISSING_UUID
     
     # Act
-    response = client.put(f"/api/projects/{fake_project_id}/vms/test-vm", json=vm_data)
+    response = client.put(f"/api/projects/{fake_project_id}/vms/test-vm", json=TEST_VM)
     
     # Assert
     assert response.status_code == 404
 
 
-def test_update_vm_invalid_data():
+@pytest.mark.parametrize("invalid_data", INVALID_VM_UPDATES)
+def test_update_vm_invalid_data(client, project_factory, invalid_data):
     """Test updating VM with invalid data."""
     # Arrange
-    create_project = client.post("/api/projects", json={"name": "invalid-update-project"})
-    project_id = create_project.json()["id"]
+    project_id = project_factory("invalid-update-project")["id"]
     
     # Create VM first
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    create_vm = client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    create_vm = client.post(f"/api/projects/{project_id}/vms", json=TEST_VM)
     assert create_vm.status_code == 201
     
-    invalid_updates = [
-        {"name": "", "box": "ubuntu/jammy64"},  # Empty name
-        {"name": "test-vm", "box": ""},  # Empty box
-        {"name": "test-vm", "box": "ubuntu/jammy64", "memory": -1},  # Invalid memory
-        {"name": "test-vm", "box": "ubuntu/jammy64", "cpus": 0},  # Invalid cpus
-        {}  # Empty object
-    ]
+    # Act
+    response = client.put(f"/api/projects/{project_id}/vms/test-vm", json=invalid_data)
     
-    for invalid_data in invalid_updates:
-        # Act
-        response = client.put(f"/api/projects/{project_id}/vms/test-vm", json=invalid_data)
-        
-        # Assert
-        assert response.status_code == 400
\ No newline at end of file
+    # Assert
+    assert response.status_code == 400
\ No newline at end of file
@@ -4,164 +4,114 @@ Integration test for multi-VM project with networking.
 This test validates end-to-end functionality for complex scenarios.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from src.main import app
+import re
 
-client = TestClient(app)
+from _payloads import TEST_VM
 
 
-@pytest.fixture(autouse=True)
-def clean_data():
-    """Clean test data before each test."""
-    import shutil
-    import os
-    data_dir = "data"
-    if os.path.exists(data_dir):
-        try:
-            shutil.rmtree(data_dir)
-        except OSError:
-            # Handle case where directory is busy (in containers)
-            pass
+# VM names and static IPs that must all appear in the generated Vagrantfile
+EXPECTED_VAGRANTFILE_TOKENS = frozenset({
+    "web-server", "database", "load-balancer",
+    "192.168.10.10", "192.168.10.20", "192.168.10.30",
+})
+EXPECTED_VAGRANTFILE_PATTERN = re.compile("|".join(map(re.escape, sorted(EXPECTED_VAGRANTFILE_TOKENS))))
 
 
-def test_multi_vm_networking_scenario():
+def test_multi_vm_networking_scenario(client, project_factory):
     """Test creating a multi-VM project with complex networking."""
     # Create a project
-    project_data = {
-        "name": "multi-vm-network-test",
-        "description": "Test project with multiple VMs and networking"
-    }
-    
-    create_response = client.post("/api/projects", json=project_data)
-    assert create_response.status_code == 201
-    project = create_response.json()
+    project = project_factory("multi-vm-network-test", description="Test project with multiple VMs and networking")
     project_id = project["id"]
     
-    # Add web server VM
-    web_vm_data = {
-        "name": "web-server",
-        "box": "ubuntu/jammy64",
-        "memory": 2048,
-        "cpus": 2,
-        "hostname": "web.local"
-    }
-    
-    web_response = client.post(f"/api/projects/{project_id}/vms", json=web_vm_data)
-    assert web_response.status_code == 201
-    
-    # Add database VM
-    db_vm_data = {
-        "name": "database",
-        "box": "ubuntu/jammy64", 
-        "memory": 1024,
-        "cpus": 1,
-        "hostname": "db.local"
-    }
-    
-    db_response = client.post(f"/api/projects/{project_id}/vms", json=db_vm_data)
-    assert db_response.status_code == 201
-    
-    # Add load balancer VM
-    lb_vm_data = {
-        "name": "load-balancer",
-        "box": "ubuntu/jammy64",
-        "memory": 512,
-        "cpus": 1,
-        "hostname": "lb.local"
-    }
-    
-    lb_response = client.post(f"/api/projects/{project_id}/vms", json=lb_vm_data)
-    assert lb_response.status_code == 201
-    
-    # Add private network interfaces
-    # Web server private network
-    web_private_interface = {
-        "type": "private_network",
-        "ip_assignment": "static",
-        "ip_address": "192.168.10.10",
-        "netmask": "255.255.255.0"
-    }
-    
-    web_interface_response = client.post(
-        f"/api/projects/{project_id}/vms/web-server/network-interfaces",
-        json=web_private_interface
-    )
-    assert web_interface_response.status_code == 201
-    
-    # Database private network
-    db_private_interface = {
-        "type": "private_network", 
-        "ip_assignment": "static",
-        "ip_address": "192.168.10.20",
-        "netmask": "255.255.255.0"
-    }
-    
-    db_interface_response = client.post(
-        f"/api/projects/{project_id}/vms/database/network-interfaces",
-        json=db_private_interface
-    )
-    assert db_interface_response.status_code == 201
-    
-    # Load balancer private network
-    lb_private_interface = {
-        "type": "private_network",
-        "ip_assignment": "static", 
-        "ip_address": "192.168.10.30",
-        "netmask": "255.255.255.0"
-    }
-    
-    lb_interface_response = client.post(
-        f"/api/projects/{project_id}/vms/load-balancer/network-interfaces",
-        json=lb_private_interface
-    )
-    assert lb_interface_response.status_code == 201
-    
-    # Add port forwarding for web access
-    web_port_forward = {
-        "type": "forwarded_port",
-        "guest_port": 80,
-        "host_port": 8080,
-        "protocol": "tcp"
-    }
-    
-    port_forward_response = client.post(
-        f"/api/projects/{project_id}/vms/load-balancer/network-interfaces",
-        json=web_port_forward
-    )
-    assert port_forward_response.status_code == 201
-    
-    # Verify project structure
-    project_response = client.get(f"/api/projects/{project_id}")
-    assert project_response.status_code == 200
-    
-    project = project_response.json()
+    # Add the whole topology - three VMs with their network interfaces - in one update
+    project["vms"] = [
+        {
+            "name": "web-server",
+            "box": "ubuntu/jammy64",
+            "memory": 2048,
+            "cpus": 2,
+            "hostname": "web.local",
+            "network_interfaces": [
+                # Web server private network
+                {
+                    "type": "private_network",
+                    "ip_assignment": "static",
+                    "ip_address": "192.168.10.10",
+                    "netmask": "255.255.255.0"
+                }
+            ]
+        },
+        {
+            "name": "database",
+            "box": "ubuntu/jammy64",
+            "memory": 1024,
+            "cpus": 1,
+            "hostname": "db.local",
+            "network_interfaces": [
+                # Database private network
+                {
+                    "type": "private_network",
+                    "ip_assignment": "static",
+                    "ip_address": "192.168.10.20",
+                    "netmask": "255.255.255.0"
+                }
+            ]
+        },
+        {
+            "name": "load-balancer",
+            "box": "ubuntu/jammy64",
+            "memory": 512,
+            "cpus": 1,
+            "hostname": "lb.local",
+            "network_interfaces": [
+                # Load balancer private network
+                {
+                    "type": "private_network",
+                    "ip_assignment": "static",
+                    "ip_address": "192.168.10.30",
+                    "netmask": "255.255.255.0"
+                },
+                # Port forwarding for web access
+                {
+                    "type": "forwarded_port",
+                    "guest_port": 80,
+                    "host_port": 8080,
+                    "protocol": "tcp"
+                }
+            ]
+        }
+    ]
+    
+    update_response = client.put(f"/api/projects/{project_id}", json=project)
+    assert update_response.status_code == 200
+    
+    # Verify project structure from the saved project the update returns
+    project = update_response.json()
     assert len(project["vms"]) == 3
     
     # Check each VM has expected configuration
     vms_by_name = {vm["name"]: vm for vm in project["vms"]}
+    assert {
+        name: {key: vm[key] for key in ("memory", "cpus", "hostname")}
+        for name, vm in vms_by_name.items()
+    } == {
+        "web-server": {"memory": 2048, "cpus": 2, "hostname": "web.local"},
+        "database": {"memory": 1024, "cpus": 1, "hostname": "db.local"},
+        "load-balancer": {"memory": 512, "cpus": 1, "hostname": "lb.local"}
+    }
     
     # Web server checks
     web_vm = vms_by_name["web-server"]
-    assert web_vm["memory"] == 2048
-    assert web_vm["cpus"] == 2
-    assert web_vm["hostname"] == "web.local"
     assert len(web_vm["network_interfaces"]) == 1
     assert web_vm["network_interfaces"][0]["ip_address"] == "192.168.10.10"
     
     # Database checks
     db_vm = vms_by_name["database"]
-    assert db_vm["memory"] == 1024
-    assert db_vm["cpus"] == 1
-    assert db_vm["hostname"] == "db.local"
     assert len(db_vm["network_interfaces"]) == 1
     assert db_vm["network_interfaces"][0]["ip_address"] == "192.168.10.20"
     
     # Load balancer checks  
     lb_vm = vms_by_name["load-balancer"]
-    assert lb_vm["memory"] == 512
-    assert lb_vm["cpus"] == 1
-    assert lb_vm["hostname"] == "lb.local"
     assert len(lb_vm["network_interfaces"]) == 2  # Private network + port forward
     
     # Check for private network interface
@@ -182,44 +132,30 @@ def test_multi_vm_networking_scenario():
     result = generation_response.json()
     vagrantfile_content = result["content"]
     
-    # Check that all VM names appear in the generated Vagrantfile
-    assert "web-server" in vagrantfile_content
-    assert "database" in vagrantfile_content  
-    assert "load-balancer" in vagrantfile_content
-    
-    # Check that network configurations are included
-    assert "192.168.10.10" in vagrantfile_content
-    assert "192.168.10.20" in vagrantfile_content
-    assert "192.168.10.30" in vagrantfile_content
+    # Check that all VM names and network configurations appear, in one pass over the content
+    assert set(EXPECTED_VAGRANTFILE_PATTERN.findall(vagrantfile_content)) == EXPECTED_VAGRANTFILE_TOKENS
     assert "forwarded_port" in vagrantfile_content or "8080" in vagrantfile_content
     
     # Verify project appears in project list
     list_response = client.get("/api/projects")
     assert list_response.status_code == 200
     
-    projects_list = list_response.json()
-    project_names = [p["name"] for p in projects_list["projects"]]
-    assert "multi-vm-network-test" in project_names
+    projects_by_name = {p["name"]: p for p in list_response.json()["projects"]}
+    assert "multi-vm-network-test" in projects_by_name
     
     # Find our project in the list and verify VM count
-    our_project = next(p for p in projects_list["projects"] if p["name"] == "multi-vm-network-test")
+    our_project = projects_by_name["multi-vm-network-test"]
     assert our_project["vm_count"] == 3
 
 
-def test_networking_validation_scenario():
+def test_networking_validation_scenario(client, project_factory):
     """Test network validation with conflicting IPs."""
     # Create project
-    project_data = {
-        "name": "network-validation-test",
-        "description": "Test network validation"
-    }
-    
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("network-validation-test", description="Test network validation")["id"]
     
     # Add two VMs
-    vm1_data = {"name": "vm1", "box": "ubuntu/jammy64"}
-    vm2_data = {"name": "vm2", "box": "ubuntu/jammy64"}
+    vm1_data = {**TEST_VM, "name": "vm1"}
+    vm2_data = {**TEST_VM, "name": "vm2"}
     
     client.post(f"/api/projects/{project_id}/vms", json=vm1_data)
     client.post(f"/api/projects/{project_id}/vms", json=vm2_data)
@@ -254,16 +190,10 @@ def test_networking_validation_scenario():
     # For now, this test documents the expected behavior
 
 
-def test_resource_intensive_scenario():
+def test_resource_intensive_scenario(client, project_factory):
     """Test scenario with high resource allocation."""
     # Create project
-    project_data = {
-        "name": "resource-intensive-test",
-        "description": "Test high resource allocation"
-    }
-    
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("resource-intensive-test", description="Test high resource allocation")["id"]
     
     # Add VM with high resource allocation
     high_resource_vm = {
@@ -6,15 +6,12 @@ MUST FAIL until the actual implementation is created.
 """
 
 import pytest
-from fastapi.testclient import TestClient
 import json
 
-from src.main import app
+from _payloads import TEST_VM
 
-client = TestClient(app)
 
-
-def test_single_vm_project_creation():
+def test_single_vm_project_creation(client):
     """Test complete single VM project creation scenario."""
     
     # Step 1-3: Create new project
@@ -79,32 +76,25 @@ def test_single_vm_project_creation():
     assert "192.168.33.10" in content
     assert "2048" in content
     
-    # Step 8: Verify project state
+    # Step 8-9: Verify the persisted project state (saved automatically)
     final_project = client.get(f"/api/projects/{project_id}")
     assert final_project.status_code == 200
     
     final_data = final_project.json()
+    assert final_data["name"] == "my-vagrant-project"
     assert len(final_data["vms"]) == 1
     assert len(final_data["vms"][0]["network_interfaces"]) == 1
     
     network_interface = final_data["vms"][0]["network_interfaces"][0]
     assert network_interface["ip_address"] == "192.168.33.10"
     assert network_interface["type"] == "private_network"
-    
-    # Step 9: Project persistence (already saved automatically)
-    # Verify we can retrieve the project again
-    retrieve_response = client.get(f"/api/projects/{project_id}")
-    assert retrieve_response.status_code == 200
-    assert retrieve_response.json()["name"] == "my-vagrant-project"
 
 
-def test_single_vm_project_validation():
+def test_single_vm_project_validation(client, project_factory):
     """Test that the single VM project passes validation."""
     
     # Create the same project as above
-    project_data = {"name": "validation-test-project"}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("validation-test-project")["id"]
     
     # Add VM
     vm_data = {
@@ -134,29 +124,23 @@ def test_single_vm_project_validation():
     assert len(validation["errors"]) == 0
 
 
-def test_single_vm_project_appears_in_list():
+def test_single_vm_project_appears_in_list(client, project_factory):
     """Test that created project appears in projects list."""
     
     # Create project
-    project_data = {"name": "list-test-project"}
-    create_response = client.post("/api/projects", json=project_data)
-    project_id = create_response.json()["id"]
+    project_id = project_factory("list-test-project")["id"]
     
     # Add VM to increase vm_count
-    vm_data = {"name": "test-vm", "box": "ubuntu/jammy64"}
-    client.post(f"/api/projects/{project_id}/vms", json=vm_data)
+    client.post(f"/api/projects/{project_id}/vms", json=TEST_VM)
     
     # Check project list
     list_response = client.get("/api/projects")
     assert list_response.status_code == 200
     
-    projects = list_response.json()["projects"]
-    test_project = next(
-        (p for p in projects if p["name"] == "list-test-project"), 
-        None
-    )
+    projects_by_name = {p["name"]: p for p in list_response.json()["projects"]}
+    assert "list-test-project" in projects_by_name
     
-    assert test_project is not None
+    test_project = projects_by_name["list-test-project"]
     assert test_project["vm_count"] == 1
     assert "created_at" in test_project
     assert "updated_at" in test_project
\ No newline at end of file
@@ -0,0 +1,19 @@
+from src.models import Project, VirtualMachine
+from src.services.vagrantfile_generator import VagrantfileGenerator
+
+
+def test_generators_share_compiled_default_template():
+    first = VagrantfileGenerator()
+    second = VagrantfileGenerator(user_id="someone-else")
+
+    assert first.template is second.template
+
+
+def test_generate_renders_with_shared_template():
+    project = Project(name="demo", vms=[VirtualMachine(name="web-server", box="ubuntu/jammy64")])
+    VagrantfileGenerator().generate(project)
+
+    result = VagrantfileGenerator().generate(project)
+
+    assert result["validation"]["is_valid"] is True
+    assert 'config.vm.define "web-server" do |web_server|' in result["content"]
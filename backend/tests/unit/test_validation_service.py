@@ -0,0 +1,176 @@
+from src.models import NetworkInterface, Project, VirtualMachine
+from src.services.validation_service import ValidationService
+
+
+def _project(**overrides):
+    data = {
+        "name": "demo",
+        "description": "Demo project",
+        "vms": [
+            VirtualMachine(
+                name="web",
+                box="ubuntu/jammy64",
+                hostname="web",
+                network_interfaces=[
+                    NetworkInterface(
+                        type="private_network",
+                        ip_assignment="static",
+                        ip_address="192.168.56.10",
+                    )
+                ],
+            )
+        ],
+    }
+    data.update(overrides)
+    return Project(**data)
+
+
+def test_validate_project_results_are_not_shared():
+    service = ValidationService()
+    project = _project()
+
+    first = service.validate_project(project)
+    first["errors"].append("mutated by caller")
+
+    assert "mutated by caller" not in service.validate_project(project)["errors"]
+
+
+def test_validate_project_reflects_edits():
+    service = ValidationService()
+    project = _project()
+    assert service.validate_project(project)["is_valid"] is True
+
+    project.vms[0].cpus = 0
+
+    result = service.validate_project(project)
+    assert result["is_valid"] is False
+    assert "VM 'web': VM must have at least 1 CPU" in result["errors"]
+
+
+def test_validate_project_reports_each_duplicate_vm_name_once():
+    service = ValidationService()
+    project = _project()
+    # The model rejects duplicates on creation, but legacy projects are loaded via construct()
+    project.vms = [VirtualMachine(name=name, box="ubuntu/jammy64") for name in ("web", "db", "web", "web")]
+
+    result = service.validate_project(project)
+
+    duplicates = [error for error in result["errors"] if error.startswith("Duplicate VM name")]
+    assert duplicates == ["Duplicate VM name: web (used by 3 VMs)"]
+
+
+def test_validate_network_interface_accepts_cidr_netmask():
+    service = ValidationService()
+    interface = NetworkInterface(
+        type="private_network", ip_assignment="static", ip_address="192.168.56.10", netmask="/24"
+    )
+
+    assert service.validate_network_interface(interface)["is_valid"] is True
+
+
+def test_validate_network_interface_rejects_non_contiguous_netmask():
+    service = ValidationService()
+    interface = NetworkInterface(type="private_network", ip_assignment="static", ip_address="192.168.56.10")
+    interface.netmask = "255.0.255.0"
+
+    result = service.validate_network_interface(interface)
+
+    assert result["is_valid"] is False
+    assert "Invalid netmask: 255.0.255.0" in result["errors"]
+
+
+def test_validate_project_reports_ip_conflicts():
+    service = ValidationService()
+    project = _project()
+    project.vms.append(
+        VirtualMachine(
+            name="db",
+            box="ubuntu/jammy64",
+            hostname="db",
+            network_interfaces=[
+                NetworkInterface(type="private_network", ip_assignment="static", ip_address="192.168.56.10")
+            ],
+        )
+    )
+
+    result = service.validate_project(project)
+
+    assert "IP address conflict: 192.168.56.10 is used by multiple VMs" in result["errors"]
+
+
+def test_validate_project_warns_about_overlapping_private_networks():
+    service = ValidationService()
+    project = _project()
+    project.vms.append(
+        VirtualMachine(
+            name="db",
+            box="ubuntu/jammy64",
+            hostname="db",
+            network_interfaces=[
+                NetworkInterface(
+                    type="private_network",
+                    ip_assignment="static",
+                    ip_address="192.168.56.20",
+                    netmask="255.255.0.0",
+                )
+            ],
+        )
+    )
+
+    result = service.validate_project(project)
+
+    assert "Overlapping networks detected: 192.168.56.0/24 and 192.168.0.0/16" in result["warnings"]
+
+
+def test_validate_project_best_practice_suggestions_grouped_per_vm():
+    service = ValidationService()
+    project = _project(description="")
+    project.vms = [VirtualMachine(name="test", box="generic/alpine318")]
+
+    result = service.validate_project(project)
+
+    assert result["suggestions"] == [
+        "Consider adding a project description",
+        "VM 'test' has a generic name - consider a more descriptive name",
+        "VM 'test' uses box 'generic/alpine318' - ensure it's available",
+        "VM 'test' has no hostname set - it will default to VM name",
+    ]
+
+
+def test_validate_vagrantfile_syntax_reports_structure_issues():
+    service = ValidationService()
+
+    result = service.validate_vagrantfile_syntax('config.vm.box = "ubuntu/jammy64\n')
+
+    assert result["is_valid"] is False
+    assert "Vagrantfile missing Vagrant.configure block" in result["errors"]
+    assert "Unmatched quotes in Vagrantfile" in result["errors"]
+    assert "No 'end' statements found - check block closures" in result["warnings"]
+    assert "Consider pinning box versions for reproducibility" in result["suggestions"]
+
+
+def test_validate_vagrantfile_syntax_accepts_pinned_box():
+    service = ValidationService()
+    content = (
+        'Vagrant.configure("2") do |config|\n'
+        '  config.vm.box = "ubuntu/jammy64"\n'
+        '  config.vm.box_version = "1.0.0"\n'
+        "end\n"
+    )
+
+    result = service.validate_vagrantfile_syntax(content)
+
+    assert result == {"is_valid": True, "errors": [], "warnings": [], "suggestions": []}
+
+
+def test_validate_vagrantfile_syntax_rejects_blank_content():
+    service = ValidationService()
+
+    result = service.validate_vagrantfile_syntax("  \n\t\n")
+
+    assert result == {
+        "is_valid": False,
+        "errors": ["Vagrantfile content is empty"],
+        "warnings": [],
+        "suggestions": [],
+    }